@@ -72,6 +72,15 @@ class AppSettings(BaseSettings):
         ),
     )
 
+    link_assets: bool = Field(
+        default=False,
+        description=(
+            "Hardlink runtime assets into the output directory instead of "
+            "copying them (falls back to copying across filesystems; the "
+            "linked files share storage with their sources)"
+        ),
+    )
+
     # Output configuration
     minify_output: bool = Field(
         default=False,
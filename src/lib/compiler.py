@@ -6,9 +6,9 @@ Transforms parsed AST nodes into complete HTML presentation.
 from __future__ import annotations
 
 import re
-from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 from ..models.compiler import (
     CompileResult,
@@ -22,12 +22,37 @@ from ..models.compiler import (
     SlideCounters,
 )
 from ..models.handlers import CompilerContext, DirectiveNode
+from ..models.parser import ContentParts, ParseResult
 from . import compiler_assets, compiler_rendering, nexus
 from .directives import DirectiveRegistry
 from .log import LOG
 from .parser import ASTNode
 from .theme import Theme
 
+if TYPE_CHECKING:
+    from pygments.formatters import HtmlFormatter
+
+# Placeholders the parser leaves for protected .code{} blocks and
+# backslash-escaped sequences, plus a leading .syntax{} on code blocks.
+CODE_PLACEHOLDER_RE: re.Pattern[str] = re.compile(r"\x00CODE_(\d+)\x00")
+ESCAPE_PLACEHOLDER_RE: re.Pattern[str] = re.compile(r"\x00ESCAPE_(\d+)\x00")
+SYNTAX_LEAD_RE: re.Pattern[str] = re.compile(r"^\s*\.syntax\{([^}]+)\}\s*")
+# In .body{} text: a run of blank lines (group 1) or a single newline
+BODY_LINE_BREAK_RE: re.Pattern[str] = re.compile(r"((?:\n\s*){2,})|(\n)")
+
+
+@lru_cache(maxsize=8)
+def codeFormatter_get(style: str) -> HtmlFormatter:
+    """Inline-style HTML formatter for a Pygments style, built once.
+
+    Building the formatter renders the style's whole stylesheet, which
+    costs more than highlighting a typical code block, and formatters
+    keep no state between ``highlight()`` calls.
+    """
+    from pygments.formatters import HtmlFormatter
+
+    return HtmlFormatter(style=style, noclasses=True)
+
 
 class Compiler:
     """
@@ -43,7 +68,7 @@ class Compiler:
 
     def __init__(
         self,
-        ast: list[ASTNode],
+        ast: list[ASTNode] | ParseResult,
         output_dir: str,
         assets_dir: str,
         verbosity: int = 1,
@@ -53,22 +78,34 @@ class Compiler:
         input_dir: str = ".",
         watch: bool = False,
         standalone: bool = False,
+        copy_assets: bool = True,
     ) -> None:
         """
         Initialize compiler
 
         Args:
-            ast: Parsed abstract syntax tree
+            ast: Parsed abstract syntax tree, or a ParseResult carrying
+                the AST together with its placeholder maps
             output_dir: Directory for compiled output
             assets_dir: Directory containing runtime assets (css/js/html)
             verbosity: Output verbosity level (0-3)
-            protected_code_blocks: Protected .code{} blocks from parser
-            escaped_sequences: Dict of backslash-escaped content from parser
+            protected_code_blocks: Protected .code{} blocks from parser;
+                overrides the ParseResult's when given
+            escaped_sequences: Dict of backslash-escaped content from
+                parser; overrides the ParseResult's when given
             theme_name: Name of theme to use (default: "default")
             input_dir: Input directory for resolving relative paths
             watch: Whether compiled output should include live-reload script
             standalone: Inline all local assets into a single HTML file
+            copy_assets: Copy runtime assets next to index.html; disable
+                when only the HTML itself is wanted
         """
+        if isinstance(ast, ParseResult):
+            if protected_code_blocks is None:
+                protected_code_blocks = ast.protected_code_blocks
+            if escaped_sequences is None:
+                escaped_sequences = ast.escaped_sequences
+            ast = ast.ast
         self.ast = ast
         self.output_dir = Path(output_dir)
         self.assets_dir = Path(assets_dir)
@@ -78,6 +115,7 @@ class Compiler:
         self.escaped_sequences = escaped_sequences or {}
         self.watch = watch
         self.standalone = standalone
+        self.copy_assets = copy_assets
         self._include_stack: set[Path] = set()
         self.directives = DirectiveRegistry()
 
@@ -133,12 +171,14 @@ class Compiler:
             )
             full_html = compiler_assets.html_inline(full_html, source_map)
             LOG("Standalone mode: assets inlined, skipping copy", level=2)
-        else:
+        elif self.copy_assets:
             self.assets_copy()
+        else:
+            LOG("Asset copying disabled, writing HTML only", level=2)
 
         # Write output file
         output_file = self.output_dir / "index.html"
-        output_file.write_text(full_html, encoding="utf-8")
+        compiler_assets.html_write(output_file, full_html)
         LOG(f"Wrote {output_file}", level=2)
 
         LOG("HTML document assembled", level=2)
@@ -186,8 +226,11 @@ class Compiler:
         Returns:
             Content with placeholders replaced by highlighted code blocks
         """
+        # Most nodes hold no code block; skip the imports and regex pass
+        if not self.protected_code_blocks or "\x00CODE_" not in content:
+            return content
+
         from pygments import highlight
-        from pygments.formatters import HtmlFormatter
         from pygments.lexer import Lexer
         from pygments.lexers import TextLexer, get_lexer_by_name
         from pygments.util import ClassNotFound
@@ -203,7 +246,7 @@ class Compiler:
             raw_content = self.protected_code_blocks[code_id]
 
             # Extract .syntax{language=X} modifier if present
-            syntax_match = re.match(r"^\s*\.syntax\{([^}]+)\}\s*", raw_content)
+            syntax_match = SYNTAX_LEAD_RE.match(raw_content)
             if syntax_match:
                 language_spec = syntax_match.group(1)
                 # Remove .syntax{} from content
@@ -230,16 +273,13 @@ class Compiler:
                 lexer = TextLexer()
 
             # Generate highlighted HTML (use theme's Pygments style)
-            pygments_style = self.theme.pygmentsStyle_get()
-            formatter = HtmlFormatter(style=pygments_style, noclasses=True)
+            formatter = codeFormatter_get(self.theme.pygmentsStyle_get())
             highlighted = cast(str, highlight(code_content, lexer, formatter))
 
             return highlighted
 
         # Replace all \x00CODE_N\x00 placeholders
-        result = re.sub(
-            r"\x00CODE_(\d+)\x00", expand_code_placeholder, content
-        )
+        result = CODE_PLACEHOLDER_RE.sub(expand_code_placeholder, content)
         return result
 
     def escapes_expand(self, content: str) -> str:
@@ -256,21 +296,23 @@ class Compiler:
         Returns:
             Content with placeholders replaced by literal escaped text
         """
+        # Most nodes hold no escapes; skip the import and regex pass
+        if not self.escaped_sequences or "\x00ESCAPE_" not in content:
+            return content
+
         import html
 
         def expand_escape_placeholder(match: re.Match[str]) -> str:
             """Expand an ESCAPE_N placeholder with literal escaped content"""
             escape_id = int(match.group(1))
-            if escape_id not in self.escaped_sequences:
+            escaped_content = self.escaped_sequences.get(escape_id)
+            if escaped_content is None:
                 return match.group(0)  # Leave placeholder if not found
 
             # Return the literal content, HTML-escaped for safety
-            escaped_content = self.escaped_sequences[escape_id]
             return html.escape(escaped_content)
 
-        result = re.sub(
-            r"\x00ESCAPE_(\d+)\x00", expand_escape_placeholder, content
-        )
+        result = ESCAPE_PLACEHOLDER_RE.sub(expand_escape_placeholder, content)
         return result
 
     def node_compile(self, node: ASTNode) -> str:
@@ -289,8 +331,6 @@ class Compiler:
         Returns:
             Compiled HTML for this node
         """
-        from ..config import appsettings
-
         # PRE-COMPILATION: increment slide counter for real slides.
         # Do this before children compile so child counters are correct.
         if node.directive == "slide" and (
@@ -298,14 +338,17 @@ class Compiler:
         ):
             self.slide_count += 1
 
-        # Step 1: Recursively compile children (inside-out)
-        compiled_children: list[str] = []
-        for child in node.children:
-            compiled_child_html = self.node_compile(child)
-            compiled_children.append(compiled_child_html)
-
-        # Step 2: Process raw text for line breaks BEFORE substituting children
-        processed_content: str = node.content
+        # Step 1: Recursively compile children (inside-out), in index
+        # order so compiled_children[i] replaces placeholder i
+        node_compile = self.node_compile
+        compiled_children: list[str] = [
+            node_compile(child) for child in node.children
+        ]
+
+        # Step 2: Split content at child placeholders and process the raw
+        # text runs for line breaks. Placeholders hold no newlines, so
+        # treating each run separately matches processing the whole string.
+        parts: ContentParts = node.parts()
         if node.directive == "body":
 
             def line_break_replacer(match: re.Match[str]) -> str:
@@ -326,17 +369,20 @@ class Compiler:
             # This single regex handles both cases:
             # 1. A block of 2 or more newlines (and optional whitespace)
             # 2. A single newline
-            processed_content = re.sub(
-                r"((?:\n\s*){2,})|(\n)", line_break_replacer, processed_content
-            )
-
-        # Step 2b: Substitute placeholders in content with compiled children
-        content_with_children: str = processed_content
-        for i, compiled_child in enumerate(compiled_children):
-            placeholder: str = appsettings.placeHolder_make(i)
-            content_with_children = content_with_children.replace(
-                placeholder, compiled_child
-            )
+            parts = [
+                (
+                    BODY_LINE_BREAK_RE.sub(line_break_replacer, part)
+                    if isinstance(part, str)
+                    else part
+                )
+                for part in parts
+            ]
+
+        # Step 2b: Join the text runs with the compiled children
+        content_with_children: str = "".join(
+            part if isinstance(part, str) else compiled_children[part]
+            for part in parts
+        )
 
         # Step 2c: Expand protected .code{} placeholders
         content_with_children = self.codeblocks_expand(content_with_children)
@@ -345,7 +391,15 @@ class Compiler:
         content_with_children = self.escapes_expand(content_with_children)
 
         # Step 3: Create a modified node with substituted content.
-        node_with_content = replace(node, content=content_with_children)
+        # Built directly rather than via dataclasses.replace(), which
+        # introspects the fields on every call.
+        node_with_content = ASTNode(
+            directive=node.directive,
+            modifiers=node.modifiers,
+            content=content_with_children,
+            children=node.children,
+            line_number=node.line_number,
+        )
 
         # Step 4: Apply directive handler
         handler = self.directives.get(node.directive)
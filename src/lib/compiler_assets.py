@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import os
 import re
 import shutil
+from collections.abc import Callable
 from pathlib import Path
 from typing import Protocol
 
@@ -13,6 +15,9 @@ from .log import LOG
 # Maps output-relative asset path → source Path for standalone inlining.
 AssetSourceMap: dict[str, Path] = {}
 
+# Output is written (and encoded) in slices of this many characters.
+HTML_WRITE_CHUNK: int = 1 << 16
+
 
 class CompilerAssets(Protocol):
     """Compiler attributes required by asset helpers."""
@@ -41,31 +46,90 @@ def template_load(compiler: CompilerAssets, filename: str) -> str:
     return ""
 
 
+def html_write(output_file: Path, html: str) -> None:
+    """Write an HTML document to disk in fixed-size slices.
+
+    ``Path.write_text`` encodes the whole document into a second,
+    equally large bytes object before writing. Streaming slices through
+    a buffered handle keeps the extra memory to one slice.
+
+    Args:
+        output_file: Destination file path.
+        html: Complete HTML document.
+    """
+    with open(
+        output_file, "w", encoding="utf-8", buffering=HTML_WRITE_CHUNK
+    ) as f:
+        for start in range(0, len(html), HTML_WRITE_CHUNK):
+            f.write(html[start : start + HTML_WRITE_CHUNK])
+
+
+def asset_linkOrCopy(src: str | Path, dst: str | Path) -> str | Path:
+    """Hardlink ``src`` to ``dst``, copying when linking is not possible.
+
+    Any existing ``dst`` is unlinked first, so a previous build's link is
+    replaced rather than written through to the shared source file.
+
+    Args:
+        src: Source file path.
+        dst: Destination file path.
+
+    Returns:
+        The destination path, as ``shutil.copytree`` copy functions must.
+    """
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
 def assets_copy(compiler: CompilerAssets) -> None:
     """Copy CSS, JavaScript, image, logo, and theme assets to output.
 
+    With ``appsettings.link_assets`` enabled, files are hardlinked where
+    the filesystem allows instead of having their bytes copied.
+
     Args:
         compiler: Active compiler instance.
     """
+    from ..config import appsettings
+
+    copy_file: Callable[[str | Path, str | Path], object] = (
+        asset_linkOrCopy if appsettings.link_assets else shutil.copy2
+    )
+
     for asset_dir in ["css", "js", "images", "logos"]:
         src = compiler.assets_dir / asset_dir
         dst = compiler.output_dir / asset_dir
 
         if src.exists():
-            shutil.copytree(src, dst, dirs_exist_ok=True)
+            shutil.copytree(
+                src, dst, copy_function=copy_file, dirs_exist_ok=True
+            )
             LOG(f"Copied {asset_dir}/ to output", level=3)
 
     theme_css_path = compiler.theme.cssPath_get()
     if theme_css_path and theme_css_path.exists():
         dst_css = compiler.output_dir / "css" / "theme.css"
         dst_css.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(theme_css_path, dst_css)
+        copy_file(theme_css_path, dst_css)
         LOG(f"Copied theme CSS: {compiler.theme.name}", level=2)
 
     theme_assets_dir = compiler.theme.assetsDir_get()
     if theme_assets_dir and theme_assets_dir.exists():
         dst_theme_assets = compiler.output_dir / "theme-assets"
-        shutil.copytree(theme_assets_dir, dst_theme_assets, dirs_exist_ok=True)
+        shutil.copytree(
+            theme_assets_dir,
+            dst_theme_assets,
+            copy_function=copy_file,
+            dirs_exist_ok=True,
+        )
         LOG(f"Copied theme assets: {theme_assets_dir}", level=3)
 
     if compiler.theme.lcars_is():
@@ -77,7 +141,7 @@ def assets_copy(compiler: CompilerAssets) -> None:
             if lcars_scripts_path.exists():
                 dst_js = compiler.output_dir / "js" / script_name
                 dst_js.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(lcars_scripts_path, dst_js)
+                copy_file(lcars_scripts_path, dst_js)
                 LOG(f"Copied LCARS script: {script_name}", level=3)
 
 
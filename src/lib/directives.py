@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import re
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, cast
 
 import cowsay as cowsay_module
@@ -22,43 +23,118 @@ from pygments.util import ClassNotFound
 from ..models.compiler import PlaceholderMap, PresentationMetaConfig
 from ..models.directives import DirectiveCategory, DirectiveSpec
 from ..models.handlers import CompilerContext, DirectiveNode
+from ..models.parser import ContentParts
 from . import directive_groups, nexus
 from .lexer import SlidedownLexer
 from .log import LOG
+from .parser import ASTNode, ast_flatten
 
 CLASS_TOKEN_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_-]*$")
+# Shape of a directive name as written in source: ``slide``, ``font-doom``
+DIRECTIVE_NAME_PATTERN = r"\w+(?:-\w+)*"
+# Code-block and escape placeholders left in content by the parser
+CODE_PLACEHOLDER_PATTERN = re.compile(r"\x00CODE_(\d+)\x00")
+ESCAPE_PLACEHOLDER_PATTERN = re.compile(r"\x00ESCAPE_(\d+)\x00")
+# Whitespace allowed between adjacent column divs in a compiled body
+COLUMN_GAP_PATTERN = re.compile(r"[ \n\t]*")
+# Typewriter text escapes: ``\\`` ``\>`` ``\<`` ``\&`` drop the backslash
+TYPEWRITER_ESCAPE_PATTERN = re.compile(r"\\([\\<>&])")
+
+
+def _ast_rebaseIDs(
+    nodes: list[ASTNode], kind: str, pattern: re.Pattern[str], offset: int
+) -> None:
+    """Rewrite ``kind`` placeholder IDs in AST content strings by offset.
+
+    Walks the flattened tree once and only runs the substitution on nodes
+    whose content holds such a placeholder at all. Nodes with children
+    keep their recorded parts, rebased run by run, so rendering them
+    never searches the new content for child placeholders.
+
+    Args:
+        nodes: List of ASTNode objects to rewrite in-place.
+        kind: Placeholder kind, e.g. ``CODE`` for ``\\x00CODE_N\\x00``.
+        pattern: Regex matching that placeholder, index in group 1.
+        offset: Integer to add to every placeholder index.
+    """
+    marker: str = f"\x00{kind}_"
+
+    def index_shift(match: re.Match[str]) -> str:
+        return f"\x00{kind}_{int(match.group(1)) + offset}\x00"
+
+    for node in ast_flatten(nodes):
+        if marker not in node.content:
+            continue
+        if not node.children:
+            node.content = pattern.sub(index_shift, node.content)
+            continue
+        # Placeholders never straddle a child slot, so rebasing each text
+        # run yields exactly the rebased content
+        parts: ContentParts = [
+            pattern.sub(index_shift, part) if isinstance(part, str) else part
+            for part in node.parts()
+        ]
+        node.content = pattern.sub(index_shift, node.content)
+        node.parts_record(parts)
 
 
-def _ast_rebaseCodeIDs(nodes: list[Any], offset: int) -> None:
+def _ast_rebaseCodeIDs(nodes: list[ASTNode], offset: int) -> None:
     """Rewrite CODE placeholder IDs in AST content strings by offset.
 
     Args:
         nodes: List of ASTNode objects to rewrite in-place.
         offset: Integer to add to every CODE_N placeholder index.
     """
-    for node in nodes:
-        node.content = re.sub(
-            r"\x00CODE_(\d+)\x00",
-            lambda m: f"\x00CODE_{int(m.group(1)) + offset}\x00",
-            node.content,
-        )
-        _ast_rebaseCodeIDs(list(node.children), offset)
+    _ast_rebaseIDs(nodes, "CODE", CODE_PLACEHOLDER_PATTERN, offset)
 
 
-def _ast_rebaseEscapeIDs(nodes: list[Any], offset: int) -> None:
+def _ast_rebaseEscapeIDs(nodes: list[ASTNode], offset: int) -> None:
     """Rewrite ESCAPE placeholder IDs in AST content strings by offset.
 
     Args:
         nodes: List of ASTNode objects to rewrite in-place.
         offset: Integer to add to every ESCAPE_N placeholder index.
     """
-    for node in nodes:
-        node.content = re.sub(
-            r"\x00ESCAPE_(\d+)\x00",
-            lambda m: f"\x00ESCAPE_{int(m.group(1)) + offset}\x00",
-            node.content,
+    _ast_rebaseIDs(nodes, "ESCAPE", ESCAPE_PLACEHOLDER_PATTERN, offset)
+
+
+def namesTrie_pattern(names: list[str]) -> str:
+    """Build a regex alternation of ``names`` shaped as a character trie.
+
+    Names sharing a prefix share one branch (``b(?:f|ody)`` rather than
+    ``bf|body``), so the regex engine rejects a non-name after reading at
+    most one character past the longest common prefix.
+
+    Args:
+        names: Literal names to match.
+
+    Returns:
+        Pattern source (without groups) matching exactly the given names.
+    """
+    trie: dict[str, Any] = {}
+    for name in names:
+        node: dict[str, Any] = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def branch_emit(node: dict[str, Any]) -> str:
+        alternatives: list[str] = [
+            re.escape(char) + branch_emit(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not alternatives:
+            return ""
+        body: str = (
+            alternatives[0]
+            if len(alternatives) == 1
+            else "(?:" + "|".join(alternatives) + ")"
         )
-        _ast_rebaseEscapeIDs(list(node.children), offset)
+        # A name may end here as well as continue (``o`` and ``o-x``)
+        return f"(?:{body})?" if "" in node else body
+
+    return branch_emit(trie)
 
 
 def classNames_normalize(raw_class_names: str) -> list[str]:
@@ -82,6 +158,75 @@ def classNames_normalize(raw_class_names: str) -> list[str]:
     return class_names
 
 
+@lru_cache(maxsize=256)
+def figlet_render(font_name: str, text: str) -> str:
+    """Render text as Figlet ASCII art, memoized per font and text.
+
+    Loading a Figlet font parses the whole font file, so repeated
+    ``.font-*{}`` directives (and rebuilds in watch mode) reuse results.
+
+    Args:
+        font_name: Figlet font name, such as ``doom``.
+        text: Text to render.
+
+    Returns:
+        Rendered ASCII art.
+
+    Raises:
+        pyfiglet.FontNotFound: If the font does not exist.
+    """
+    return Figlet(font=font_name).renderText(text)
+
+
+@lru_cache(maxsize=256)
+def cowsay_render(char_name: str, text: str) -> str:
+    """Render a cowsay speech bubble, memoized per character and text.
+
+    Args:
+        char_name: Cowsay character name, such as ``tux``.
+        text: Text for the speech bubble.
+
+    Returns:
+        Rendered speech bubble with character art.
+
+    Raises:
+        cowsay.CowsayError: If the character does not exist.
+    """
+    return cast(str, cowsay_module.get_output_string(char_name, text))
+
+
+def divClose_find(html: str, open_pos: int) -> int:
+    """Find the end of the ``</div>`` closing the ``<div`` at ``open_pos``.
+
+    Jumps between successive ``<div`` and ``</div>`` tags with
+    ``str.find`` while tracking nesting depth, instead of testing every
+    character position.
+
+    Args:
+        html: HTML to scan.
+        open_pos: Index of the opening ``<div`` in html.
+
+    Returns:
+        Index just past the matching ``</div>``, or -1 if it is never
+        closed.
+    """
+    depth: int = 1
+    next_open: int = html.find("<div", open_pos + 4)
+    next_close: int = html.find("</div>", open_pos + 4)
+
+    while next_close != -1:
+        if next_open != -1 and next_open < next_close:
+            depth += 1
+            next_open = html.find("<div", next_open + 4)
+        else:
+            depth -= 1
+            if depth == 0:
+                return next_close + 6
+            next_close = html.find("</div>", next_close + 6)
+
+    return -1
+
+
 def metaYaml_dedent(yaml_content: str) -> str:
     """Dedent parser-skewed YAML metadata content.
 
@@ -146,11 +291,20 @@ class DirectiveRegistry:
 
     Attributes:
         specs: Mapping of directive names and aliases to directive specs.
+        wildcard_specs: Pattern-based specs (e.g. ``font-*``), consulted
+            only when a name has no exact or alias entry in ``specs``.
+        unresolved: Memo of names that missed ``specs``, mapped to the
+            wildcard spec they matched or None; cleared on registration.
+        opener_re: Compiled ``.name{`` pattern for registered names, built
+            on first use by openerPattern_get; cleared on registration.
     """
 
     def __init__(self) -> None:
         """Initialize the registry with built-in directives."""
         self.specs: dict[str, DirectiveSpec] = {}
+        self.wildcard_specs: list[DirectiveSpec] = []
+        self.unresolved: dict[str, DirectiveSpec | None] = {}
+        self.opener_re: re.Pattern[str] | None = None
         self.coreDirectives_register()
         self.formattingDirectives_register()
         self.effectDirectives_register()
@@ -170,6 +324,73 @@ class DirectiveRegistry:
         for alias in spec.aliases:
             self.specs[alias] = spec
 
+        # Keep the wildcard list in step: a re-registered pattern replaces
+        # its predecessor rather than shadowing it.
+        self.wildcard_specs = [
+            wildcard
+            for wildcard in self.wildcard_specs
+            if wildcard.name != spec.name
+        ]
+        if spec.is_wildcard:
+            self.wildcard_specs.append(spec)
+        self.unresolved.clear()
+        self.opener_re = None
+
+    def spec_resolve(self, name: str) -> DirectiveSpec | None:
+        """Resolve a directive name to its specification.
+
+        Exact names and aliases resolve with a single dict lookup. Names
+        that miss walk the wildcard list once; the outcome, including "no
+        such directive", is memoized so repeats are a second dict lookup.
+
+        Args:
+            name: Directive name to look up.
+
+        Returns:
+            Directive specification, or None when no directive matches.
+        """
+        spec: DirectiveSpec | None = self.specs.get(name)
+        if spec is not None:
+            return spec
+        if name in self.unresolved:
+            return self.unresolved[name]
+
+        for wildcard in self.wildcard_specs:
+            if wildcard.matches(name):
+                spec = wildcard
+                break
+
+        self.unresolved[name] = spec
+        return spec
+
+    def openerPattern_get(self) -> re.Pattern[str]:
+        """Get the pattern matching ``.name{`` for registered names only.
+
+        Exact names and aliases are matched through a character trie, and
+        each wildcard contributes its prefix followed by a name tail, so
+        reading a directive name and validating it is one regex search.
+        Group 1 is the directive name.
+
+        Returns:
+            Compiled opener pattern, cached until the next registration.
+        """
+        if self.opener_re is None:
+            name_re: re.Pattern[str] = re.compile(DIRECTIVE_NAME_PATTERN)
+            alternatives: list[str] = [
+                re.escape(wildcard.wildcard_prefix) + DIRECTIVE_NAME_PATTERN
+                for wildcard in self.wildcard_specs
+                if wildcard.wildcard_prefix is not None
+            ]
+            alternatives.append(
+                namesTrie_pattern(
+                    [name for name in self.specs if name_re.fullmatch(name)]
+                )
+            )
+            self.opener_re = re.compile(
+                r"\.(" + "|".join(alternatives) + r")\{"
+            )
+        return self.opener_re
+
     def get(
         self, name: str
     ) -> Callable[[DirectiveNode, CompilerContext], str] | None:
@@ -183,16 +404,8 @@ class DirectiveRegistry:
         Returns:
             Handler function, or None when no directive matches.
         """
-        # Direct match
-        if name in self.specs:
-            return self.specs[name].handler
-
-        # Wildcard matching - check all specs
-        for spec in self.specs.values():
-            if spec.is_wildcard and spec.matches(name):
-                return spec.handler
-
-        return None
+        spec: DirectiveSpec | None = self.spec_resolve(name)
+        return spec.handler if spec is not None else None
 
     def spec_get(self, name: str) -> DirectiveSpec | None:
         """Get full directive specification by name.
@@ -203,15 +416,7 @@ class DirectiveRegistry:
         Returns:
             Directive specification, or None when no directive matches.
         """
-        if name in self.specs:
-            return self.specs[name]
-
-        # Wildcard matching
-        for spec in self.specs.values():
-            if spec.is_wildcard and spec.matches(name):
-                return spec
-
-        return None
+        return self.spec_resolve(name)
 
     def directives_listByCategory(
         self, category: DirectiveCategory
@@ -275,16 +480,15 @@ class DirectiveRegistry:
             address_attr: str = f' data-address="{address}"' if address else ""
 
             # Build CSS classes - add alignment class if specified
-            css_classes: str = "container slide"
+            class_list: list[str] = ["container", "slide"]
             align: str = node.modifiers.get("align", "")
             if align:
-                css_classes += f" align-{align}"
+                class_list.append(f"align-{align}")
 
-            user_classes: list[str] = classNames_normalize(
-                node.modifiers.get("class", "")
+            class_list.extend(
+                classNames_normalize(node.modifiers.get("class", ""))
             )
-            if user_classes:
-                css_classes += f" {' '.join(user_classes)}"
+            css_classes: str = " ".join(class_list)
 
             # Slides start hidden; JavaScript shows the active slide.
             user_style: str = node.modifiers.get("style", "")
@@ -490,74 +694,47 @@ class DirectiveRegistry:
                 result: list[str] = []
                 i: int = 0
                 while i < len(content):
+                    # Copy everything up to the next column-ish tag as is
+                    tag_start: int = content.find('<div class="column', i)
+                    if tag_start == -1:
+                        result.append(content[i:])
+                        break
+                    result.append(content[i:tag_start])
+                    i = tag_start
+
                     # Explicit .columns{} groups own their child columns.
                     # Skip their entire block so the legacy adjacency scanner
                     # below does not re-wrap inner .column{} elements.
-                    if content[i:].startswith('<div class="columns'):
-                        depth: int = 0
-                        j: int = i
-                        while j < len(content):
-                            if content[j : j + 4] == "<div":
-                                depth += 1
-                            elif content[j : j + 6] == "</div>":
-                                depth -= 1
-                                if depth == 0:
-                                    col_group_end: int = j + 6
-                                    result.append(content[i:col_group_end])
-                                    i = col_group_end
-                                    break
-                            j += 1
-                        else:
+                    if content.startswith('<div class="columns', i):
+                        col_group_end: int = divClose_find(content, i)
+                        if col_group_end == -1:
                             result.append(content[i])
                             i += 1
+                        else:
+                            result.append(content[i:col_group_end])
+                            i = col_group_end
                         continue
 
-                    # Look for start of column
-                    if content[i:].startswith('<div class="column"'):
-                        # Collect all consecutive column blocks.
-                        columns: list[str] = []
-
-                        while (
-                            i < len(content)
-                            and '<div class="column"' in content[i : i + 20]
-                        ):
-                            # Match closing </div> by nesting depth.
-                            tag_start: int = content.find(
-                                '<div class="column"', i
-                            )
-                            depth: int = 0
-                            j: int = tag_start
-
-                            while j < len(content):
-                                if content[j : j + 4] == "<div":
-                                    depth += 1
-                                elif content[j : j + 6] == "</div>":
-                                    depth -= 1
-                                    if depth == 0:
-                                        # Found matching closing tag
-                                        col_end: int = j + 6
-                                        columns.append(
-                                            content[tag_start:col_end]
-                                        )
-                                        i = col_end
-                                        break
-                                j += 1
-
-                            # Skip whitespace between columns
-                            while i < len(content) and content[i] in " \n\t":
-                                i += 1
-
-                            # Check if next thing is another column
-                            if not content[i:].startswith(
-                                '<div class="column"'
-                            ):
-                                break
-
-                        # Wrap all collected columns in flex container
-                        if columns:
-                            result.append('<div style="display: flex;">\n')
-                            result.append("\n".join(columns))
-                            result.append("\n</div>\n")
+                    # Collect all consecutive column blocks.
+                    columns: list[str] = []
+                    while content.startswith('<div class="column"', i):
+                        # Match closing </div> by nesting depth.
+                        col_end: int = divClose_find(content, i)
+                        if col_end == -1:
+                            break
+                        columns.append(content[i:col_end])
+                        i = col_end
+
+                        # Skip whitespace between columns
+                        gap = COLUMN_GAP_PATTERN.match(content, i)
+                        if gap:
+                            i = gap.end()
+
+                    # Wrap all collected columns in flex container
+                    if columns:
+                        result.append('<div style="display: flex;">\n')
+                        result.append("\n".join(columns))
+                        result.append("\n</div>\n")
                     else:
                         result.append(content[i])
                         i += 1
@@ -702,11 +879,12 @@ class DirectiveRegistry:
             # \< → < (literal less-than)
             # \& → & (literal ampersand)
             # \\ → \ (literal backslash)
-            text_content: str = content.replace("\\\\", "\x00BACKSLASH\x00")
-            text_content = text_content.replace("\\>", ">")
-            text_content = text_content.replace("\\<", "<")
-            text_content = text_content.replace("\\&", "&")
-            text_content = text_content.replace("\x00BACKSLASH\x00", "\\")
+            # One left-to-right pass, so \\> stays a backslash then >.
+            text_content: str = content
+            if "\\" in text_content:
+                text_content = TYPEWRITER_ESCAPE_PATTERN.sub(
+                    r"\1", text_content
+                )
 
             # Store text in data attribute to bypass HTML entity parsing issues
             # Escape quotes for attribute safety
@@ -795,12 +973,11 @@ class DirectiveRegistry:
 
             style_attr: str = f' style="{"; ".join(styles)}"'
 
-            user_classes: list[str] = classNames_normalize(
-                node.modifiers.get("class", "")
+            class_list: list[str] = ["columns"]
+            class_list.extend(
+                classNames_normalize(node.modifiers.get("class", ""))
             )
-            class_names: str = "columns"
-            if user_classes:
-                class_names += f" {' '.join(user_classes)}"
+            class_names: str = " ".join(class_list)
 
             return (
                 f'<div class="{class_names}"{style_attr}>'
@@ -898,8 +1075,7 @@ class DirectiveRegistry:
             )
 
             try:
-                f: Figlet = Figlet(font=font_name)
-                ascii_art: str = f.renderText(node.content)
+                ascii_art: str = figlet_render(font_name, node.content)
                 return f'<pre class="figlet-art">{ascii_art}</pre>'
             except Exception:
                 return (
@@ -928,9 +1104,7 @@ class DirectiveRegistry:
             )
 
             try:
-                result: str = cowsay_module.get_output_string(
-                    char_name, node.content
-                )
+                result: str = cowsay_render(char_name, node.content)
                 return f"<pre>{result}</pre>"
             except Exception:
                 return (
@@ -1234,8 +1408,10 @@ class DirectiveRegistry:
 
             try:
                 source = target.read_text(encoding="utf-8")
-                parser = Parser(source, debug=False)
-                included_ast = parser.parse()
+                # Same file included twice (or rebuilt in watch mode) is
+                # parsed once; the returned AST is ours to rebase.
+                parser = Parser.parse_cached(source)
+                included_ast = parser.ast
 
                 # Strip top-level .meta{} nodes — parent deck is authoritative
                 filtered_ast = [
@@ -7,7 +7,7 @@ The parser operates in two phases:
 2. Processing: Extract content, handle nesting, create AST nodes
 
 Key features:
-- Recursive descent parsing for nested directives
+- Stack-based parsing of nested directives
 - Placeholder substitution for children (\x00CHILD_N\x00)
 - Modifier extraction (.style{}, .class{})
 - Brace depth tracking for proper nesting
@@ -25,22 +25,146 @@ Example:
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from ..models.compiler import PlaceholderMap
 from ..models.parser import (
+    ContentFrame,
+    ContentParts,
     DirectiveMatch,
     ExtractedModifiers,
     Modifiers,
+    ParseResult,
     ProcessedContent,
 )
 
 if TYPE_CHECKING:
     from .directives import DirectiveRegistry
 
+# Directive openers: ``\.name\{`` / ``\.name{`` when escaped (plain
+# ``.name{`` openers come from DirectiveRegistry.openerPattern_get). Compiled
+# once and driven with an explicit ``pos`` so scanning never slices the
+# source.
+ESCAPED_OPEN_RE: re.Pattern[str] = re.compile(r"\\\.(\w+(?:-\w+)*)\\?\{")
+MODIFIER_OPEN_RE: re.Pattern[str] = re.compile(r"\.((style|class|syntax))\{")
+SYNTAX_LEAD_RE: re.Pattern[str] = re.compile(r"\s*\.syntax\{")
+MODIFIER_LEAD_RE: re.Pattern[str] = re.compile(
+    r"\s*\.(?:style|class|syntax)\{"
+)
+# ``.style{}`` values may carry ``align=`` and ``width=`` settings, which
+# are lifted into their own modifiers and stripped from the CSS.
+STYLE_ALIGN_RE: re.Pattern[str] = re.compile(r"align\s*=\s*(\w+)")
+STYLE_ALIGN_STRIP_RE: re.Pattern[str] = re.compile(r"align\s*=\s*\w+\s*;?\s*")
+STYLE_WIDTH_RE: re.Pattern[str] = re.compile(r"width\s*=\s*([\w%]+)")
+STYLE_WIDTH_STRIP_RE: re.Pattern[str] = re.compile(
+    r"width\s*=\s*[\w%]+\s*;?\s*"
+)
+# A backslash pair ending a line is an explicit line break
+LINE_BREAK_MARK_RE: re.Pattern[str] = re.compile(r"\\\\(?=\s*\n)")
+# A (possibly empty) whitespace run; skipping with one match keeps the
+# character loop in C.
+WHITESPACE_RE: re.Pattern[str] = re.compile(r"\s*")
+# Inside an escaped directive both ``\{``/``\}`` and bare braces count
+# towards nesting; the stored text keeps them all unescaped.
+ESCAPED_BRACE_RE: re.Pattern[str] = re.compile(r"\\?[{}]")
+BRACE_UNESCAPE_RE: re.Pattern[str] = re.compile(r"\\([{}])")
+# Escape placeholders for the ids real documents use, built once
+ESCAPE_PLACEHOLDERS: tuple[str, ...] = tuple(
+    f"\x00ESCAPE_{escape_id}\x00" for escape_id in range(256)
+)
+
+# Sources longer than this (in characters) bypass Parser.parse_cached, so a
+# very large deck is not kept alive by the cache.
+PARSE_CACHE_MAX_SOURCE: int = 64 * 1024
+
+
+def braceClose_find(text: str, open_pos: int) -> int:
+    """
+    Find the brace closing the ``{`` at ``open_pos``
+
+    Jumps between successive ``{`` and ``}`` with ``str.find`` (which
+    uses C-level fast search) instead of stepping through every character,
+    keeping a depth counter along the way.
+
+    Args:
+        text: String to scan
+        open_pos: Index of the opening '{' in text
+
+    Returns:
+        Index of the matching '}', or -1 if the brace is never closed
+    """
+    depth: int = 1
+    next_open: int = text.find("{", open_pos + 1)
+    next_close: int = text.find("}", open_pos + 1)
+
+    while next_close != -1:
+        if next_open != -1 and next_open < next_close:
+            depth += 1
+            next_open = text.find("{", next_open + 1)
+        else:
+            depth -= 1
+            if depth == 0:
+                return next_close
+            next_close = text.find("}", next_close + 1)
+
+    return -1
+
+
+def bracePairs_map(text: str) -> dict[int, int]:
+    """
+    Pair every ``{`` in text with its closing ``}`` in one pass
+
+    Gives the same answer as braceClose_find for every opening brace, with
+    the same str.find jumps, but walks the text once instead of once per
+    nesting level. Unclosed ``{``
+    are left out and stray ``}`` are ignored.
+
+    Args:
+        text: String to scan
+
+    Returns:
+        Dict mapping the index of each closed '{' to its matching '}'
+    """
+    pairs: dict[int, int] = {}
+    opens: list[int] = []
+    next_open: int = text.find("{")
+    next_close: int = text.find("}")
+
+    while next_close != -1:
+        if next_open != -1 and next_open < next_close:
+            opens.append(next_open)
+            next_open = text.find("{", next_open + 1)
+        else:
+            if opens:
+                pairs[opens.pop()] = next_close
+            next_close = text.find("}", next_close + 1)
+
+    return pairs
+
 
-@dataclass
+def whitespace_skip(text: str, pos: int) -> int:
+    """Index of the first non-whitespace character at or after pos."""
+    match = WHITESPACE_RE.match(text, pos)
+    return match.end() if match else pos
+
+
+@lru_cache(maxsize=8)
+def childPlaceholders_get(prefix: str, suffix: str) -> tuple[str, ...]:
+    """Child placeholders for indices 0-255, built once per prefix/suffix."""
+    return tuple(f"{prefix}{index}{suffix}" for index in range(256))
+
+
+@lru_cache(maxsize=8)
+def childPattern_get(prefix: str, suffix: str) -> re.Pattern[str]:
+    """Compiled regex matching child placeholders for a prefix/suffix."""
+    return re.compile(re.escape(prefix) + r"(\d+)" + re.escape(suffix))
+
+
+@dataclass(slots=True)
 class ASTNode:
     """
     Represents a node in the abstract syntax tree
@@ -77,6 +201,147 @@ class ASTNode:
     content: str
     children: list[ASTNode]
     line_number: int
+    # Parts the parser recorded while building content, and the content
+    # string and child count they describe; stale once either changes.
+    _parts: ContentParts | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _parts_content: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _parts_children: int = field(
+        default=0, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Intern the directive name, however the node was constructed."""
+        self.directive = sys.intern(self.directive)
+
+    def parts_record(self, parts: ContentParts) -> None:
+        """
+        Remember how the current content splits into parts
+
+        The parser knows where it put each child placeholder, so it hands
+        the split over instead of letting parts() search for them again.
+        The record only holds while content is the same string object
+        and the number of children is unchanged.
+
+        Args:
+            parts: Text runs and child indices that join to content
+        """
+        self._parts = parts
+        self._parts_content = self.content
+        self._parts_children = len(self.children)
+
+    def parts(self) -> ContentParts:
+        """
+        Split content at its child placeholders
+
+        Renderers join the returned list, swapping each int for the
+        compiled child it indexes, instead of searching the content for
+        every child. Placeholders with no matching child stay as text.
+        Content straight from the parser is not searched at all; the
+        split recorded by parts_record() is reused.
+
+        Returns:
+            Literal text runs interleaved with child indices; content
+            without children is a single text run
+
+        Example:
+            For content "Hello \x00CHILD_0\x00 world" with one child:
+            ["Hello ", 0, " world"]
+        """
+        if not self.children:
+            return [self.content]
+        if (
+            self._parts is not None
+            and self._parts_content is self.content
+            and self._parts_children == len(self.children)
+        ):
+            return list(self._parts)
+
+        from ..config import appsettings
+
+        pattern: re.Pattern[str] = childPattern_get(
+            appsettings.placeholder_prefix, appsettings.placeholder_suffix
+        )
+        content: str = self.content
+        child_count: int = len(self.children)
+        parts: ContentParts = []
+        last_end: int = 0
+
+        for match in pattern.finditer(content):
+            index: int = int(match.group(1))
+            if index >= child_count:
+                continue
+            parts.append(content[last_end : match.start()])
+            parts.append(index)
+            last_end = match.end()
+
+        parts.append(content[last_end:])
+        return parts
+
+    def clone(self) -> ASTNode:
+        """
+        Return an independent copy of this node and its subtree
+
+        Builds the copy field by field rather than via copy.deepcopy, which
+        goes through the generic memo and reduce machinery for every node.
+        Strings are immutable and shared; the modifier dict and children
+        list are fresh. The subtree is walked with an explicit stack, like
+        ast_flatten, so any tree the parser builds can be cloned however
+        deep it nests.
+
+        Returns:
+            New ASTNode equal to this one, sharing no mutable state
+        """
+
+        def node_copy(node: ASTNode) -> ASTNode:
+            copy: ASTNode = ASTNode(
+                directive=node.directive,
+                modifiers=dict(node.modifiers),
+                content=node.content,
+                children=[],
+                line_number=node.line_number,
+            )
+            # Recorded parts are never mutated, so the copy may share them;
+            # the children filled in below bring the count back in line.
+            copy._parts = node._parts
+            copy._parts_content = node._parts_content
+            copy._parts_children = node._parts_children
+            return copy
+
+        root: ASTNode = node_copy(self)
+        stack: list[tuple[ASTNode, ASTNode]] = [(self, root)]
+        while stack:
+            original, copied = stack.pop()
+            for child in original.children:
+                child_copy: ASTNode = node_copy(child)
+                copied.children.append(child_copy)
+                stack.append((child, child_copy))
+        return root
+
+
+def ast_flatten(nodes: list[ASTNode]) -> list[ASTNode]:
+    """
+    List every node of an AST forest in document order
+
+    Whole-tree passes (placeholder rebasing, searches) iterate the flat
+    list once instead of recursing through each node's children.
+
+    Args:
+        nodes: Top-level AST nodes
+
+    Returns:
+        All nodes, each parent before its children (pre-order)
+    """
+    flat: list[ASTNode] = []
+    stack: list[ASTNode] = nodes[::-1]
+    while stack:
+        node: ASTNode = stack.pop()
+        flat.append(node)
+        stack.extend(reversed(node.children))
+    return flat
 
 
 class Parser:
@@ -91,6 +356,19 @@ class Parser:
     - Backslash escaping (\.directive\{...\} for literal syntax)
     """
 
+    # Fixed attribute layout: the scanning loops read and write position
+    # and line_number constantly, and slots skip the per-instance dict.
+    __slots__ = (
+        "source",
+        "debug",
+        "position",
+        "line_number",
+        "ast",
+        "protected_code_blocks",
+        "escaped_sequences",
+        "registry",
+    )
+
     def __init__(
         self,
         source: str,
@@ -115,13 +393,8 @@ class Parser:
             registry: DirectiveRegistry for validating directive names
             escaped_sequences: Dict mapping placeholders to escaped content
         """
-        self.source = source
         self.debug = debug
-        self.position = 0
-        self.line_number = 1
-        self.ast: list[ASTNode] = []
-        self.protected_code_blocks: PlaceholderMap = {}
-        self.escaped_sequences: PlaceholderMap = {}
+        self.reset(source)
 
         # Import and create registry if not provided
         if registry is None:
@@ -130,6 +403,26 @@ class Parser:
             registry = DirectiveRegistry()
         self.registry = registry
 
+    def reset(self, source: str) -> None:
+        """
+        Prepare the parser for a new source, keeping its registry
+
+        Building a DirectiveRegistry dominates the cost of a new Parser, so
+        callers that parse many sources in turn (watch mode, test suites)
+        can reuse one parser instead. Results of the previous parse are
+        rebound rather than cleared: an AST or placeholder map already
+        handed to a Compiler is left untouched.
+
+        Args:
+            source: Raw slidedown source text to parse next
+        """
+        self.source = source
+        self.position = 0
+        self.line_number = 1
+        self.ast: list[ASTNode] = []
+        self.protected_code_blocks: PlaceholderMap = {}
+        self.escaped_sequences: PlaceholderMap = {}
+
     def escapes_protect(self, source: str) -> str:
         r"""
         Pre-process source to protect backslash-escaped sequences
@@ -146,89 +439,73 @@ class Parser:
             Output: ".tt{Use \x00ESCAPE_0\x00 syntax}"
             Stores: escaped_sequences[0] = ".directive{content}"
         """
+        # Most sources escape nothing; skip building a copy of them.
+        if "\\." not in source:
+            return source
+
         result: list[str] = []
         pos: int = 0
         escape_id: int = 0
 
-        while pos < len(source):
-            # Look for backslash before dot
-            if (
-                pos < len(source) - 1
-                and source[pos] == "\\"
-                and source[pos + 1] == "."
-            ):
-                # Found \. - scan forward to find the pattern
-                # Match \.word\{ ... \}
-                match = re.match(r"\\\.(\w+(?:-\w+)*)\\?\{", source[pos:])
-                if match:
-                    # Found escaped directive pattern like \.directive\{
-                    directive_name: str = match.group(1)
-                    brace_start: int = pos + match.end() - 1
-
-                    # Find if the { is escaped too
-                    if source[brace_start] == "\\":
-                        brace_start += 1  # Skip the backslash
-
-                    # Now find matching \} (escaped closing brace)
-                    depth: int = 1
-                    brace_pos: int = brace_start + 1
-                    escaped_content: str = f".{directive_name}{{"
-
-                    while brace_pos < len(source) and depth > 0:
-                        if (
-                            brace_pos < len(source) - 1
-                            and source[brace_pos : brace_pos + 2] == "\\}"
-                        ):
-                            depth -= 1
-                            if depth == 0:
-                                escaped_content += "}"
-                                brace_pos += 2
-                                break
-                            else:
-                                escaped_content += "}"
-                                brace_pos += 2
-                        elif (
-                            brace_pos < len(source) - 1
-                            and source[brace_pos : brace_pos + 2] == "\\{"
-                        ):
-                            depth += 1
-                            escaped_content += "{"
-                            brace_pos += 2
-                        elif source[brace_pos] == "{":
-                            depth += 1
-                            escaped_content += source[brace_pos]
-                            brace_pos += 1
-                        elif source[brace_pos] == "}":
-                            depth -= 1
-                            if depth > 0:
-                                escaped_content += source[brace_pos]
-                            else:
-                                escaped_content += "}"
-                            brace_pos += 1
-                        else:
-                            escaped_content += source[brace_pos]
-                            brace_pos += 1
+        while True:
+            # Jump to the next backslash-dot; everything before it is
+            # ordinary text and is copied in one slice.
+            escape_pos: int = source.find("\\.", pos)
+            if escape_pos == -1:
+                break
+            result.append(source[pos:escape_pos])
+            pos = escape_pos
 
+            # Found \. - scan forward to find the pattern
+            # Match \.word\{ ... \}
+            match = ESCAPED_OPEN_RE.match(source, pos)
+            if match:
+                # Found escaped directive pattern like \.directive\{
+                directive_name: str = match.group(1)
+                brace_start: int = match.end() - 1
+
+                # Find if the { is escaped too
+                if source[brace_start] == "\\":
+                    brace_start += 1  # Skip the backslash
+
+                # Now find matching \} (escaped closing brace)
+                depth: int = 1
+                brace_end: int = -1
+                for brace in ESCAPED_BRACE_RE.finditer(
+                    source, brace_start + 1
+                ):
+                    depth += 1 if brace.group()[-1] == "{" else -1
                     if depth == 0:
-                        # Successfully found escaped directive
-                        self.escaped_sequences[escape_id] = escaped_content
-                        placeholder: str = f"\x00ESCAPE_{escape_id}\x00"
-                        result.append(placeholder)
-                        escape_id += 1
-                        pos = brace_pos
-                    else:
-                        # Unmatched braces, keep original
-                        result.append(source[pos])
-                        pos += 1
+                        brace_end = brace.end()
+                        break
+
+                if brace_end != -1:
+                    # Successfully found escaped directive
+                    escaped_content: str = (
+                        f".{directive_name}{{"
+                        + BRACE_UNESCAPE_RE.sub(
+                            r"\1", source[brace_start + 1 : brace_end]
+                        )
+                    )
+                    self.escaped_sequences[escape_id] = escaped_content
+                    placeholder: str = (
+                        ESCAPE_PLACEHOLDERS[escape_id]
+                        if escape_id < len(ESCAPE_PLACEHOLDERS)
+                        else f"\x00ESCAPE_{escape_id}\x00"
+                    )
+                    result.append(placeholder)
+                    escape_id += 1
+                    pos = brace_end
                 else:
-                    # Not an escaped directive, keep the backslash
+                    # Unmatched braces, keep original
                     result.append(source[pos])
                     pos += 1
             else:
-                # Regular character
+                # Not an escaped directive, keep the backslash
                 result.append(source[pos])
                 pos += 1
 
+        result.append(source[pos:])
         return "".join(result)
 
     def codeblocks_protect(self) -> str:
@@ -249,43 +526,45 @@ class Parser:
                 ".syntax{language=python}\ndef foo(): pass\n"
             )
         """
+        source: str = self.source
         result: list[str] = []
         pos: int = 0
         code_id: int = 0
 
-        while pos < len(self.source):
-            # Look for .code{ directive
-            match = re.match(r"\.code\{", self.source[pos:])
-            if match:
-                # Found .code{ - find matching closing brace
-                brace_start: int = pos + match.end() - 1
-                brace_end: int = self.brace_findMatching(brace_start)
+        while True:
+            # Jump straight to the next .code{ directive
+            code_pos: int = source.find(".code{", pos)
+            if code_pos == -1:
+                break
 
-                # Extract raw content (including .syntax{} modifier if present)
-                raw_content: str = self.source[brace_start + 1 : brace_end]
+            # Keep the text before it unchanged
+            result.append(source[pos:code_pos])
 
-                # Only protect if it has .syntax{} modifier.
-                # Inline .code{} should be processed normally
-                if re.match(r"^\s*\.syntax\{", raw_content):
-                    # Store protected content
-                    self.protected_code_blocks[code_id] = raw_content
+            # Found .code{ - find matching closing brace
+            brace_start: int = code_pos + len(".code")
+            brace_end: int = self.brace_findMatching(brace_start)
 
-                    # Replace entire .code{...} with placeholder
-                    result.append(f".code{{\x00CODE_{code_id}\x00}}")
-                    code_id += 1
+            # Extract raw content (including .syntax{} modifier if present)
+            raw_content: str = source[brace_start + 1 : brace_end]
 
-                    # Skip past this .code{} block
-                    pos = brace_end + 1
-                else:
-                    # Keep non-highlighted .code{} directives intact so the
-                    # handler can process them normally.
-                    result.append(self.source[pos : brace_end + 1])
-                    pos = brace_end + 1
+            # Only protect if it has .syntax{} modifier.
+            # Inline .code{} should be processed normally
+            if SYNTAX_LEAD_RE.match(raw_content):
+                # Store protected content
+                self.protected_code_blocks[code_id] = raw_content
+
+                # Replace entire .code{...} with placeholder
+                result.append(f".code{{\x00CODE_{code_id}\x00}}")
+                code_id += 1
             else:
-                # Regular character, keep it
-                result.append(self.source[pos])
-                pos += 1
+                # Keep non-highlighted .code{} directives intact so the
+                # handler can process them normally.
+                result.append(source[code_pos : brace_end + 1])
+
+            # Skip past this .code{} block
+            pos = brace_end + 1
 
+        result.append(source[pos:])
         return "".join(result)
 
     def parse(self) -> list[ASTNode]:
@@ -293,7 +572,8 @@ class Parser:
         Parse source text into abstract syntax tree
 
         Main entry point for parsing. Scans source for top-level .directive{}
-        patterns, processes each recursively, and returns an AST forest.
+        patterns, processes each along with its nested directives, and
+        returns an AST forest.
 
         Returns:
             List of top-level ASTNode objects, one per top-level directive.
@@ -318,7 +598,8 @@ class Parser:
 
         # Pre-process: convert explicit trailing line-break markers to <br>.
         # Literal backslashes in inline text are preserved.
-        self.source = re.sub(r"\\\\(?=\s*\n)", "<br>", self.source)
+        if "\\\\" in self.source:
+            self.source = LINE_BREAK_MARK_RE.sub("<br>", self.source)
 
         # Pre-process: protect .code{} blocks from parsing
         self.source = self.codeblocks_protect()
@@ -330,18 +611,18 @@ class Parser:
 
         self.position = 0
         self.line_number = 1
-
-        while self.position < len(self.source):
-            # Skip whitespace
-            while (
-                self.position < len(self.source)
-                and self.source[self.position].isspace()
-            ):
-                if self.source[self.position] == "\n":
-                    self.line_number += 1
-                self.position += 1
-
-            if self.position >= len(self.source):
+        source: str = self.source
+        length: int = len(source)
+        brace_pairs: dict[int, int] = bracePairs_map(source)
+
+        while self.position < length:
+            # Skip whitespace, counting the newlines it spans
+            position: int = self.position
+            skip_end: int = whitespace_skip(source, position)
+            self.line_number += source.count("\n", position, skip_end)
+            self.position = position = skip_end
+
+            if position >= length:
                 break
 
             # Find next directive
@@ -353,24 +634,27 @@ class Parser:
             directive_pos: int = match.position
 
             # Find opening brace
-            brace_pos: int = self.source.find("{", directive_pos)
+            brace_pos: int = source.find("{", directive_pos)
             if brace_pos == -1:
                 self.error(
                     f"Expected '{{' after directive '.{directive_name}'"
                 )
 
             # Find matching closing brace
-            try:
-                close_brace_pos: int = self.brace_findMatching(brace_pos)
-            except SyntaxError:
-                raise
-
-            # Extract content
-            content: str = self.source[brace_pos + 1 : close_brace_pos]
+            close_brace_pos: int = brace_pairs.get(brace_pos, -1)
+            if close_brace_pos == -1:
+                raise SyntaxError(
+                    f"Unmatched brace at line {self.line_number}, "
+                    f"position {brace_pos}"
+                )
 
-            # Process content recursively
-            processed: ProcessedContent = self.content_processRecursive(
-                content, self.line_number
+            # Process content in place, without slicing it out first
+            processed: ProcessedContent = self.content_process(
+                source,
+                self.line_number,
+                brace_pos + 1,
+                close_brace_pos,
+                brace_pairs,
             )
 
             # Create AST node
@@ -381,13 +665,111 @@ class Parser:
                 children=processed.children,
                 line_number=self.line_number,
             )
+            if processed.parts is not None:
+                node.parts_record(processed.parts)
             nodes.append(node)
 
             # Move position past this directive
             self.position = close_brace_pos + 1
 
+        self.ast = nodes
         return nodes
 
+    def parse_result(self) -> ParseResult:
+        """
+        Parse the source and return the AST with its placeholder maps
+
+        Like parse(), but bundles the placeholder maps the compiler needs
+        with the AST, so the result stands on its own.
+
+        Returns:
+            ParseResult holding this parse's AST, protected code blocks and
+            escaped sequences
+
+        Raises:
+            SyntaxError: If source has malformed directives or braces
+        """
+        return ParseResult(
+            ast=self.parse(),
+            protected_code_blocks=self.protected_code_blocks,
+            escaped_sequences=self.escaped_sequences,
+        )
+
+    @classmethod
+    def parse_many(
+        cls,
+        sources: Iterable[str],
+        registry: DirectiveRegistry | None = None,
+    ) -> list[ParseResult]:
+        """
+        Parse a batch of sources with one parser
+
+        Batch callers (documentation builds, corpus checks) would otherwise
+        pay for a Parser, and its DirectiveRegistry, per source. One parser
+        is reset for each source instead; every result keeps its own AST
+        and placeholder maps.
+
+        Args:
+            sources: Raw slidedown source texts
+            registry: Optional DirectiveRegistry shared by every parse
+
+        Returns:
+            One ParseResult per source, in order
+
+        Raises:
+            SyntaxError: If any source is malformed
+        """
+        parser: Parser = cls("", registry=registry)
+        results: list[ParseResult] = []
+        for source in sources:
+            parser.reset(source)
+            results.append(parser.parse_result())
+        return results
+
+    @classmethod
+    def parse_cached(cls, source: str) -> Parser:
+        """
+        Return a parser that has already parsed ``source``
+
+        Parsing is deterministic in the source text and the placeholder
+        settings, so identical sources (repeated includes, watch-mode
+        rebuilds, test fixtures) share one parse. The cache keeps only the
+        ParseResult, built with one shared default directive registry.
+        The returned parser is private to the caller: it is reset to
+        ``source`` and holds a clone of the cached result, so mutating it
+        cannot affect the cache.
+
+        Only sources up to PARSE_CACHE_MAX_SOURCE characters are cached;
+        larger ones are parsed afresh on every call.
+
+        Args:
+            source: Raw slidedown source text
+
+        Returns:
+            Parser whose ``ast``, ``protected_code_blocks`` and
+            ``escaped_sequences`` hold the parse results
+
+        Raises:
+            SyntaxError: If the source is malformed (not cached)
+        """
+        if len(source) > PARSE_CACHE_MAX_SOURCE:
+            fresh: Parser = cls(source)
+            fresh.parse()
+            return fresh
+
+        from ..config import appsettings
+
+        parsed: ParseResult = _source_parsed(
+            source,
+            appsettings.placeholder_prefix,
+            appsettings.placeholder_suffix,
+        ).clone()
+        parser: Parser = cls(source, registry=_registry_default())
+        parser.ast = parsed.ast
+        parser.protected_code_blocks = parsed.protected_code_blocks
+        parser.escaped_sequences = parsed.escaped_sequences
+        return parser
+
     def directive_find(self) -> DirectiveMatch | None:
         """
         Find next .directive{ pattern in source from current position
@@ -413,25 +795,17 @@ class Parser:
             For source ".invalid{text}" where "invalid" is not registered:
             Returns None (skips invalid directives)
         """
-        pattern: str = r"\.(\w+(?:-\w+)*)\{"
-        search_pos: int = self.position
-
-        while search_pos < len(self.source):
-            match = re.search(pattern, self.source[search_pos:])
-            if not match:
-                return None
-
-            directive: str = match.group(1)
-            pos: int = search_pos + match.start()
-
-            # Check if this directive name is registered
-            if self.registry.get(directive) is not None:
-                return DirectiveMatch(name=directive, position=pos)
-
-            # Not a valid directive, skip past it and continue searching
-            search_pos = pos + match.end()
+        # The opener pattern only matches registered names, so unregistered
+        # ones like .directive{} are passed over inside the regex search.
+        match = self.registry.openerPattern_get().search(
+            self.source, self.position
+        )
+        if not match:
+            return None
 
-        return None
+        # Interned so registry and reserved-name lookups hit by identity
+        directive: str = sys.intern(match.group(1))
+        return DirectiveMatch(name=directive, position=match.start())
 
     def brace_findMatching(self, start_pos: int) -> int:
         """
@@ -455,40 +829,47 @@ class Parser:
 
             Depth tracking: {1 function() {2 return {3}2; }1}0
         """
-        depth: int = 1
-        pos: int = start_pos + 1
-
-        while pos < len(self.source) and depth > 0:
-            if self.source[pos] == "{":
-                depth += 1
-            elif self.source[pos] == "}":
-                depth -= 1
-            pos += 1
+        close_pos: int = braceClose_find(self.source, start_pos)
 
-        if depth != 0:
+        if close_pos == -1:
             raise SyntaxError(
                 f"Unmatched brace at line {self.line_number}, "
                 f"position {start_pos}"
             )
 
-        return pos - 1
+        return close_pos
 
-    def content_processRecursive(
-        self, content: str, line_num: int
+    def content_process(
+        self,
+        source: str,
+        line_num: int,
+        start: int = 0,
+        end: int | None = None,
+        brace_pairs: dict[int, int] | None = None,
     ) -> ProcessedContent:
         """
-        Recursively process directive content to extract nested directives
+        Process directive content to extract nested directives
 
         Core parsing logic that transforms raw content into structured form:
         1. Extract modifiers (.style{}, .class{}) from content start
         2. Find nested .directive{} patterns
-        3. Recursively process each nested directive's content
+        3. Process each nested directive's content the same way
         4. Replace nested directives with placeholders (\x00CHILD_N\x00)
         5. Build list of child ASTNodes
 
+        Nested bodies are handled with an explicit stack of ContentFrame
+        entries over the one source string, rather than by recursing on a
+        sliced copy of each body, so deep nesting costs neither Python call
+        frames nor repeated copies of the enclosing text. Closing braces
+        come from one bracePairs_map of the source, so nested bodies are
+        not rescanned at every level.
+
         Args:
-            content: Raw content string from inside directive braces
+            source: String holding the content
             line_num: Source line number for nested directive errors
+            start: Index where the content starts in source
+            end: Index where the content ends (default: end of source)
+            brace_pairs: bracePairs_map of source, if the caller has one
 
         Returns:
             ProcessedContent containing:
@@ -496,6 +877,10 @@ class Parser:
                 - children: Child ASTNodes indexed to match placeholders
                 - modifiers: Extracted modifier directives dict
 
+        Raises:
+            SyntaxError: If a nested directive or modifier has an unmatched
+                brace
+
         Example:
             Input: ".style{color:red} Hello .bf{world}"
             Output: ProcessedContent(
@@ -506,82 +891,144 @@ class Parser:
         """
         from ..config import appsettings
 
-        # Extract modifiers first
-        extracted: ExtractedModifiers = self.modifiers_extract(content)
-        modifiers: Modifiers = extracted.modifiers
-        remaining_content: str = extracted.remaining
-
-        # Find and replace nested directives with placeholders
-        children: list[ASTNode] = []
-        processed: str = remaining_content
-        child_index: int = 0
-
-        # Scan for nested directives
-        pos = 0
-        while pos < len(processed):
-            # Look for .directive{ pattern
-            match = re.search(r"\.(\w+(?:-\w+)*)\{", processed[pos:])
-            if not match:
-                break
-
-            directive_name = match.group(1)
-            match_start: int = pos + match.start()
-            brace_start = pos + match.end() - 1
+        opener: re.Pattern[str] = self.registry.openerPattern_get()
+        placeholders: tuple[str, ...] = childPlaceholders_get(
+            appsettings.placeholder_prefix, appsettings.placeholder_suffix
+        )
+        if brace_pairs is None:
+            brace_pairs = bracePairs_map(source)
+        stack: list[ContentFrame] = [
+            self.frame_open(
+                source, "", start, len(source) if end is None else end
+            )
+        ]
 
-            # Check if this is a valid registered directive
-            if self.registry.get(directive_name) is None:
-                # Not a valid directive, skip past it and continue
-                pos = pos + match.end()
-                continue
+        while True:
+            frame: ContentFrame = stack[-1]
+            parent: ContentFrame
+            child: ASTNode
+            child_start: int
+            child_end: int
 
-            # Find matching closing brace
-            depth = 1
-            brace_pos = brace_start + 1
-            while brace_pos < len(processed) and depth > 0:
-                if processed[brace_pos] == "{":
-                    depth += 1
-                elif processed[brace_pos] == "}":
-                    depth -= 1
-                brace_pos += 1
-
-            if depth != 0:
-                raise SyntaxError(
-                    "Unmatched brace in nested directive "
-                    f"'.{directive_name}' at line {line_num}"
+            # Descend into the next nested (registered) directive, if any
+            match = opener.search(source, frame.pos, frame.end)
+            if match:
+                directive_name: str = sys.intern(match.group(1))
+                brace_start: int = match.end() - 1
+                brace_end: int = brace_pairs.get(brace_start, -1)
+                if brace_end == -1 or brace_end >= frame.end:
+                    raise SyntaxError(
+                        "Unmatched brace in nested directive "
+                        f"'.{directive_name}' at line {line_num}"
+                    )
+                if source.find(".", brace_start + 1, brace_end) != -1:
+                    stack.append(
+                        self.frame_open(
+                            source,
+                            directive_name,
+                            brace_start + 1,
+                            brace_end,
+                            match.start(),
+                        )
+                    )
+                    continue
+
+                # Leaf fast path: with no "." the body can hold neither a
+                # modifier nor a nested directive, so it is the content.
+                parent = frame
+                child = ASTNode(
+                    directive=directive_name,
+                    modifiers={},
+                    content=source[brace_start + 1 : brace_end],
+                    children=[],
+                    line_number=line_num,
                 )
-
-            brace_end: int = brace_pos - 1
-
-            # Extract nested content
-            nested_content: str = processed[brace_start + 1 : brace_end]
-
-            # Recursively process nested content
-            processed_child: ProcessedContent = self.content_processRecursive(
-                nested_content, line_num
+                child_start, child_end = match.start(), brace_end
+            else:
+                # Body exhausted: nested directives become placeholders;
+                # text between them is joined once, not rebuilt per child.
+                content: str = source[frame.segment_start : frame.end]
+                parts: ContentParts | None = None
+                if frame.segments:
+                    frame.segments.append(content)
+                    frame.parts.append(content)
+                    content = "".join(frame.segments)
+                    parts = frame.parts
+
+                stack.pop()
+                if not stack:
+                    return ProcessedContent(
+                        content=content,
+                        children=frame.children,
+                        modifiers=frame.modifiers,
+                        parts=parts,
+                    )
+
+                parent = stack[-1]
+                child = ASTNode(
+                    directive=frame.directive,
+                    modifiers=frame.modifiers,
+                    content=content,
+                    children=frame.children,
+                    line_number=line_num,
+                )
+                if parts is not None:
+                    child.parts_record(parts)
+                child_start, child_end = frame.start, frame.end
+
+            # Attach the child to its parent body behind a placeholder
+            child_index: int = len(parent.children)
+            text: str = source[parent.segment_start : child_start]
+            parent.segments.append(text)
+            parent.segments.append(
+                placeholders[child_index]
+                if child_index < len(placeholders)
+                else appsettings.placeHolder_make(child_index)
             )
+            parent.parts.append(text)
+            parent.parts.append(child_index)
+            parent.children.append(child)
+            parent.segment_start = parent.pos = child_end + 1
 
-            # Create child node
-            child: ASTNode = ASTNode(
-                directive=directive_name,
-                modifiers=processed_child.modifiers,
-                content=processed_child.content,
-                children=processed_child.children,
-                line_number=line_num,
-            )
-            children.append(child)
+    def frame_open(
+        self,
+        source: str,
+        directive: str,
+        begin: int,
+        end: int,
+        start: int = 0,
+    ) -> ContentFrame:
+        """
+        Start a ContentFrame for the body source[begin:end]
 
-            # Replace directive with placeholder
-            placeholder = appsettings.placeHolder_make(child_index)
-            processed = (
-                processed[:match_start] + placeholder + processed[brace_pos:]
-            )
+        Leading modifiers are consumed here, so the frame's scan begins
+        after them (or at begin when there are none, keeping leading
+        whitespace).
 
-            # Adjust position for placeholder/original length differences.
-            pos = match_start + len(placeholder)
-            child_index += 1
+        Args:
+            source: String holding the body
+            directive: Name of the directive owning the body
+            begin: Index of the body's first character
+            end: Index just past the body's last character
+            start: Index of the directive's "." in the enclosing body
 
-        return ProcessedContent(
-            content=processed, children=children, modifiers=modifiers
+        Returns:
+            ContentFrame positioned at the first non-modifier character
+        """
+        modifiers: Modifiers = {}
+        pos: int = begin
+        # Most bodies carry no modifiers; settle that without slicing
+        if MODIFIER_LEAD_RE.match(source, begin, end):
+            offset: int
+            modifiers, offset = self.modifiers_scan(source[begin:end])
+            pos += offset
+        return ContentFrame(
+            directive=directive,
+            start=start,
+            end=end,
+            pos=pos,
+            segment_start=pos,
+            modifiers=modifiers,
         )
 
     def modifiers_extract(self, content: str) -> ExtractedModifiers:
@@ -619,19 +1066,44 @@ class Parser:
             Input: "  Plain text"
             Output: ExtractedModifiers(modifiers={}, remaining="  Plain text")
         """
+        modifiers: Modifiers
+        content_start: int
+        modifiers, content_start = self.modifiers_scan(content)
+        return ExtractedModifiers(
+            modifiers=modifiers, remaining=content[content_start:]
+        )
+
+    def modifiers_scan(self, content: str) -> tuple[Modifiers, int]:
+        """
+        Scan modifier directives at the beginning of content
+
+        Does the work of modifiers_extract but reports where the remaining
+        content starts instead of slicing it off, so content_process can
+        continue its child scan from that index.
+
+        Args:
+            content: Raw content string to scan for modifiers
+
+        Returns:
+            Tuple of the modifiers dict and the index where the remaining
+            content begins (0 when there are no modifiers, so leading
+            whitespace is preserved)
+        """
         modifiers: Modifiers = {}
-        pos = 0
+
+        # Most content carries no modifiers; settle that with one match
+        if not MODIFIER_LEAD_RE.match(content):
+            return modifiers, 0
 
         # Skip leading whitespace to find modifiers
-        while pos < len(content) and content[pos].isspace():
-            pos += 1
+        pos = whitespace_skip(content, 0)
 
         # Check if there's a modifier at this position
         first_modifier_found: bool = False
 
         # Look for .style{}, .class{}, and .syntax{} at the start
         while pos < len(content):
-            match = re.match(r"^\.((style|class|syntax))\{", content[pos:])
+            match = MODIFIER_OPEN_RE.match(content, pos)
             if not match:
                 break
 
@@ -639,23 +1111,17 @@ class Parser:
             if not first_modifier_found:
                 first_modifier_found = True
 
-            modifier_name = match.group(1)
-            brace_start = pos + match.end() - 1
+            # Interned like directive names; keys are shared across nodes
+            modifier_name: str = sys.intern(match.group(1))
+            brace_start = match.end() - 1
 
             # Find matching closing brace
-            depth = 1
-            brace_pos = brace_start + 1
-            while brace_pos < len(content) and depth > 0:
-                if content[brace_pos] == "{":
-                    depth += 1
-                elif content[brace_pos] == "}":
-                    depth -= 1
-                brace_pos += 1
-
-            if depth != 0:
+            brace_end: int = braceClose_find(content, brace_start)
+            if brace_end == -1:
                 raise SyntaxError(
                     f"Unmatched brace in modifier '.{modifier_name}'"
                 )
+            brace_pos: int = brace_end + 1
 
             # Extract modifier value
             modifier_value: str = content[brace_start + 1 : brace_pos - 1]
@@ -665,38 +1131,34 @@ class Parser:
                 style_value: str = modifier_value
 
                 # Extract align= if present
-                align_match = re.search(r"align\s*=\s*(\w+)", style_value)
+                align_match = STYLE_ALIGN_RE.search(style_value)
                 if align_match:
                     modifiers["align"] = align_match.group(1)
-                    style_value = re.sub(
-                        r"align\s*=\s*\w+\s*;?\s*", "", style_value
+                    style_value = STYLE_ALIGN_STRIP_RE.sub(
+                        "", style_value
                     ).strip()
 
                 # Extract width= if present
-                width_match = re.search(r"width\s*=\s*([\w%]+)", style_value)
+                width_match = STYLE_WIDTH_RE.search(style_value)
                 if width_match:
                     modifiers["width"] = width_match.group(1)
-                    style_value = re.sub(
-                        r"width\s*=\s*[\w%]+\s*;?\s*", "", style_value
+                    style_value = STYLE_WIDTH_STRIP_RE.sub(
+                        "", style_value
                     ).strip()
 
                 modifiers[modifier_name] = style_value.strip()
             else:
                 modifiers[modifier_name] = modifier_value
 
-            # Move past this modifier
-            pos = brace_pos
+            # Move past this modifier and the whitespace after it
+            pos = whitespace_skip(content, brace_pos)
 
-            # Skip whitespace after modifier
-            while pos < len(content) and content[pos].isspace():
-                pos += 1
-
-        # If no modifiers found, return original content
+        # If no modifiers found, the content starts at the beginning
         if not first_modifier_found:
-            return ExtractedModifiers(modifiers=modifiers, remaining=content)
+            return modifiers, 0
 
-        # Return content with modifiers removed
-        return ExtractedModifiers(modifiers=modifiers, remaining=content[pos:])
+        # Content with modifiers removed starts here
+        return modifiers, pos
 
     def error(self, message: str) -> None:
         """
@@ -731,3 +1193,23 @@ class Parser:
             f"Context: ...{context}...\n"
             f"         {' ' * (self.position - context_start)}^"
         )
+
+
+@lru_cache(maxsize=1)
+def _registry_default() -> DirectiveRegistry:
+    """The default directive registry shared by cached parses."""
+    from .directives import DirectiveRegistry
+
+    return DirectiveRegistry()
+
+
+@lru_cache(maxsize=1024)
+def _source_parsed(source: str, prefix: str, suffix: str) -> ParseResult:
+    """
+    Parse ``source`` once per placeholder prefix/suffix
+
+    Backs Parser.parse_cached. The prefix and suffix are part of the key
+    because the parsed content embeds the child placeholders; callers
+    must clone the result before handing it out.
+    """
+    return Parser(source, registry=_registry_default()).parse_result()
@@ -8,13 +8,28 @@ specialized themes such as LCARS.
 
 from __future__ import annotations
 
+import os
 import sys
+from functools import cached_property
 from pathlib import Path
 
 import yaml
 
 from ..models.compiler import CSSConfig, ConfigValue
 
+# Prefer libyaml's C loader when PyYAML was built against it.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Descriptive keys conventionally placed at the top of theme.yaml, and how
+# much of the file theme_headerPeek() reads to find them.
+THEME_HEADER_KEYS: tuple[str, ...] = (
+    "name",
+    "description",
+    "author",
+    "version",
+)
+THEME_HEADER_BYTES = 2048
+
 
 class ThemeError(Exception):
     """Raised when theme loading or validation fails."""
@@ -28,7 +43,7 @@ class Theme:
         themes_dir: Base directory that contains available themes.
         theme_dir: Directory for the selected theme.
         config_path: Path to the selected theme's ``theme.yaml``.
-        config: Parsed theme configuration.
+        config: Parsed theme configuration (loaded lazily).
         css_path: Path to the selected theme's ``theme.css``.
         assets_dir: Optional theme assets directory.
     """
@@ -46,21 +61,37 @@ class Theme:
         self.name: str = theme_name
         self.themes_dir: Path = self.themeBaseDir_resolve(themes_dir)
         self.theme_dir: Path = self.themes_dir / theme_name
+        self.config_path: Path = self.theme_dir / "theme.yaml"
 
-        if not self.theme_dir.exists():
+        # One stat of theme.yaml answers both questions on the happy path;
+        # the directory is only examined to word the error.
+        try:
+            os.stat(self.config_path)
+        except OSError:
+            if not os.path.isdir(self.theme_dir):
+                raise ThemeError(
+                    f"Theme '{theme_name}' not found. "
+                    f"Expected directory: {self.theme_dir}"
+                ) from None
             raise ThemeError(
-                f"Theme '{theme_name}' not found. "
-                f"Expected directory: {self.theme_dir}"
-            )
-
-        self.config_path: Path = self.theme_dir / "theme.yaml"
-        if not self.config_path.exists():
-            raise ThemeError(f"Theme '{theme_name}' missing theme.yaml")
+                f"Theme '{theme_name}' missing theme.yaml"
+            ) from None
 
-        self.config: CSSConfig = self._config_load()
         self.css_path: Path = self.theme_dir / "theme.css"
         self.assets_dir: Path = self.theme_dir / "assets"
 
+    @cached_property
+    def config(self) -> CSSConfig:
+        """Parsed theme configuration, loaded on first access.
+
+        Asset-copying and CSS path resolution never need ``theme.yaml``, so
+        the parse is deferred until a configuration value is requested.
+
+        Raises:
+            ThemeError: If YAML parsing or file reading fails.
+        """
+        return self._config_load()
+
     @staticmethod
     def themeBaseDir_resolve(themes_dir: str) -> Path:
         """Resolve the base directory that contains themes.
@@ -100,19 +131,7 @@ class Theme:
         Raises:
             ThemeError: If YAML parsing or file reading fails.
         """
-        try:
-            with open(self.config_path) as f:
-                config: ConfigValue = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ThemeError(f"Failed to parse theme.yaml: {e}") from e
-        except Exception as e:
-            raise ThemeError(f"Failed to load theme.yaml: {e}") from e
-
-        if config is None:
-            return {}
-        if not isinstance(config, dict):
-            raise ThemeError("theme.yaml must contain a mapping")
-        return config
+        return _config_read(self.config_path)
 
     def css_has(self) -> bool:
         """Check whether the theme has a custom CSS file.
@@ -178,6 +197,10 @@ class Theme:
         Returns:
             Configuration value or default.
         """
+        # Most lookups are top-level keys; skip the split for those.
+        if "." not in key:
+            return self.config.get(key, default)
+
         keys: list[str] = key.split(".")
         value: ConfigValue = self.config
 
@@ -189,20 +212,105 @@ class Theme:
 
         return value
 
+    @cached_property
+    def pygmentsStyle(self) -> str:
+        """Pygments style name for syntax highlighting.
+
+        Resolved once per theme, since every highlighted code block asks
+        for it and the configuration does not change after loading.
+        """
+        value: object = self.config_get("code.pygments_style", "monokai")
+        return str(value)
+
     def pygmentsStyle_get(self) -> str:
         """Get Pygments style name for syntax highlighting.
 
         Returns:
             Pygments style name.
         """
-        value: object = self.config_get("code.pygments_style", "monokai")
-        return str(value)
+        return self.pygmentsStyle
 
     def __repr__(self) -> str:
         """Return a compact debug representation."""
         return f"Theme(name='{self.name}', path='{self.theme_dir}')"
 
 
+def _config_read(config_path: Path) -> CSSConfig:
+    """Read and parse a complete ``theme.yaml`` file.
+
+    Args:
+        config_path: Path to the ``theme.yaml`` file.
+
+    Returns:
+        Parsed configuration mapping; empty when the file is empty.
+
+    Raises:
+        ThemeError: If YAML parsing or file reading fails.
+    """
+    try:
+        # Hand the raw bytes to the loader: it detects the encoding itself,
+        # so there is no separate text-decoding pass.
+        raw: bytes = config_path.read_bytes()
+        config: ConfigValue = yaml.load(raw, Loader=_SafeLoader)
+    except yaml.YAMLError as e:
+        raise ThemeError(f"Failed to parse theme.yaml: {e}") from e
+    except Exception as e:
+        raise ThemeError(f"Failed to load theme.yaml: {e}") from e
+
+    if config is None:
+        return {}
+    if not isinstance(config, dict):
+        raise ThemeError("theme.yaml must contain a mapping")
+    return config
+
+
+def theme_headerPeek(config_path: Path) -> CSSConfig | None:
+    """Read the descriptive header of a ``theme.yaml`` file.
+
+    Only the first ``THEME_HEADER_BYTES`` are parsed, cut back to the last
+    complete line, which is enough to find the top-of-file header keys
+    without parsing colour palettes and font tables. If that slice does not
+    parse on its own, the whole file is parsed instead.
+
+    Args:
+        config_path: Path to the ``theme.yaml`` file.
+
+    Returns:
+        Mapping holding whichever of ``THEME_HEADER_KEYS`` are present, or
+        None when the file cannot be read or is not a YAML mapping.
+    """
+    try:
+        with open(config_path, "rb") as f:
+            head: bytes = f.read(THEME_HEADER_BYTES + 1)
+    except OSError:
+        return None
+
+    config: ConfigValue = None
+    peeked: bool = False
+    line_end: int = len(head)
+    if len(head) > THEME_HEADER_BYTES:
+        line_end = head.rfind(b"\n", 0, THEME_HEADER_BYTES) + 1
+
+    if line_end > 0:
+        try:
+            config = yaml.load(head[:line_end], Loader=_SafeLoader)
+            peeked = True
+        except yaml.YAMLError:
+            pass
+
+    if not peeked:
+        try:
+            config = _config_read(config_path)
+        except ThemeError:
+            return None
+
+    if config is None:
+        return {}
+    if not isinstance(config, dict):
+        return None
+    return {key: config[key] for key in THEME_HEADER_KEYS if key in config}
+
+
 def themes_listAvailable(themes_dir: str = "themes") -> list[str]:
     """List all available theme names.
 
@@ -214,17 +322,50 @@ def themes_listAvailable(themes_dir: str = "themes") -> list[str]:
     """
     themes_path: Path = Theme.themeBaseDir_resolve(themes_dir)
 
-    if not themes_path.exists():
+    try:
+        entries = os.scandir(themes_path)
+    except OSError:
         return []
 
+    # DirEntry.is_dir() answers from the directory listing itself, so each
+    # candidate costs a single stat for its theme.yaml.
     themes: list[str] = []
-    for item in themes_path.iterdir():
-        if item.is_dir() and (item / "theme.yaml").exists():
-            themes.append(item.name)
+    with entries:
+        for entry in entries:
+            if entry.is_dir() and os.path.isfile(
+                os.path.join(entry.path, "theme.yaml")
+            ):
+                themes.append(entry.name)
 
     return sorted(themes)
 
 
+def themes_describeAvailable(
+    themes_dir: str = "themes",
+) -> dict[str, CSSConfig]:
+    """Describe all available themes from their ``theme.yaml`` headers.
+
+    Args:
+        themes_dir: Path to themes directory.
+
+    Returns:
+        Mapping of theme name to its header fields (name, description,
+        author, version), in sorted theme-name order. Themes whose
+        ``theme.yaml`` cannot be parsed are omitted.
+    """
+    themes_path: Path = Theme.themeBaseDir_resolve(themes_dir)
+
+    headers: dict[str, CSSConfig] = {}
+    for theme_name in themes_listAvailable(themes_dir):
+        header: CSSConfig | None = theme_headerPeek(
+            themes_path / theme_name / "theme.yaml"
+        )
+        if header is not None:
+            headers[theme_name] = header
+
+    return headers
+
+
 def theme_validate(
     theme_name: str, themes_dir: str = "themes"
 ) -> tuple[bool, str]:
@@ -239,6 +380,8 @@ def theme_validate(
     """
     try:
         theme: Theme = Theme(theme_name, themes_dir)
+        # Parse now so configuration errors outrank the CSS warning.
+        config: CSSConfig = theme.config
 
         if not theme.css_has():
             return (
@@ -246,7 +389,7 @@ def theme_validate(
                 f"Warning: Theme '{theme_name}' has no theme.css file",
             )
 
-        if not theme.config:
+        if not config:
             return False, f"Theme '{theme_name}' has empty configuration"
 
         return True, f"Theme '{theme_name}' is valid"
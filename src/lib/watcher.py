@@ -183,6 +183,7 @@ def watcher_serve(state: ProgramState) -> None:
     """
     from ..lib.compiler import Compiler
     from ..lib.parser import Parser
+    from ..models.parser import ParseResult
 
     broadcaster = SSEBroadcaster()
     output_dir = state.htmlOutputdir
@@ -206,6 +207,12 @@ def watcher_serve(state: ProgramState) -> None:
     print("[watch] Press Ctrl-C to stop.\n")
 
     last_mtime: float = source_file.stat().st_mtime
+    # One parser (and directive registry) serves every rebuild
+    parser = Parser("", debug=(state.verbosity >= 3))
+    # Saves that leave the text unchanged (or touch the file to pick up an
+    # edited include) recompile without parsing again.
+    last_source: str | None = None
+    last_parsed: ParseResult | None = None
 
     try:
         while True:
@@ -226,15 +233,15 @@ def watcher_serve(state: ProgramState) -> None:
 
             try:
                 source = source_file.read_text(encoding="utf-8")
-                parser = Parser(source, debug=(state.verbosity >= 3))
-                ast = parser.parse()
+                if last_parsed is None or source != last_source:
+                    parser.reset(source)
+                    last_parsed = parser.parse_result()
+                    last_source = source
                 compiler = Compiler(
-                    ast=ast,
+                    ast=last_parsed.clone(),
                     output_dir=str(output_dir),
                     assets_dir=str(state.assetsInputdir),
                     verbosity=state.verbosity,
-                    protected_code_blocks=parser.protected_code_blocks,
-                    escaped_sequences=parser.escaped_sequences,
                     theme_name=state.themeName,
                     input_dir=str(state.inputdir),
                     watch=True,
@@ -6,7 +6,12 @@ Contains data structures and type definitions for the compilation pipeline.
 
 from .compiler import CompileResult, PresentationMetaConfig
 from .directives import RESERVED_DIRECTIVES, DirectiveCategory, DirectiveSpec
-from .parser import DirectiveMatch, ExtractedModifiers, ProcessedContent
+from .parser import (
+    DirectiveMatch,
+    ExtractedModifiers,
+    ParseResult,
+    ProcessedContent,
+)
 from .state import ProgramState, pipeline
 
 __all__ = [
@@ -20,4 +25,5 @@ __all__ = [
     "DirectiveMatch",
     "ProcessedContent",
     "ExtractedModifiers",
+    "ParseResult",
 ]
@@ -5,6 +5,7 @@ Defines the structure and categories of slidedown directives for
 validation, documentation generation, and registry management.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -27,7 +28,7 @@ class DirectiveCategory(Enum):
     METADATA = "metadata"  # .meta{}, .comment{}
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectiveSpec:
     """
     Specification for a slidedown directive
@@ -57,6 +58,29 @@ class DirectiveSpec:
     examples: list[str] = field(default_factory=list)
     aliases: list[str] = field(default_factory=list)
 
+    # Lookups precomputed from the fields above, since matches() runs for
+    # every directive encountered against every wildcard spec.
+    _alias_set: frozenset[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    _wildcard_prefix: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Intern names; precompute alias set and wildcard prefix."""
+        self.name = sys.intern(self.name)
+        self.aliases = [sys.intern(alias) for alias in self.aliases]
+        self._alias_set = frozenset(self.aliases)
+        if self.is_wildcard and "-" in self.name:
+            # Extract prefix (e.g., 'font-*' -> 'font-')
+            self._wildcard_prefix = self.name.rsplit("-", 1)[0] + "-"
+
+    @property
+    def wildcard_prefix(self) -> str | None:
+        """Name prefix a wildcard spec matches (``font-*`` → ``font-``)"""
+        return self._wildcard_prefix
+
     def matches(self, directive_name: str) -> bool:
         """
         Check if this spec matches a directive name
@@ -74,25 +98,24 @@ class DirectiveSpec:
             return True
 
         # Check aliases
-        if directive_name in self.aliases:
+        if directive_name in self._alias_set:
             return True
 
-        # Wildcard match
-        if self.is_wildcard:
-            # Extract prefix (e.g., 'font-*' -> 'font-')
-            if "-" in self.name:
-                prefix = self.name.rsplit("-", 1)[0] + "-"
-                if directive_name.startswith(prefix):
-                    return True
+        # Wildcard match against the precomputed prefix
+        if self._wildcard_prefix is not None:
+            return directive_name.startswith(self._wildcard_prefix)
 
         return False
 
 
 # Reserved directives that are handled specially by the parser
 RESERVED_DIRECTIVES: set[str] = {
-    "style",  # .style{css} - extracted as modifier
-    "class",  # .class{classname} - extracted as modifier
-    "syntax",  # .syntax{language=X} - extracted as modifier for .code{}
+    sys.intern(name)
+    for name in (
+        "style",  # .style{css} - extracted as modifier
+        "class",  # .class{classname} - extracted as modifier
+        "syntax",  # .syntax{language=X} - extracted as modifier for .code{}
+    )
 }
 
 
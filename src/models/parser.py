@@ -4,9 +4,11 @@ Parser-specific data models
 Type-safe structures for parser operations and return values.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, TypeAlias
 
+from .compiler import PlaceholderMap
+
 if TYPE_CHECKING:
     from ..lib.parser import ASTNode
 
@@ -14,8 +16,12 @@ if TYPE_CHECKING:
 # e.g. {"style": "color: red", "class": "highlight"}
 Modifiers: TypeAlias = dict[str, str]
 
+# Node content split at child placeholders: literal text runs interleaved
+# with child indices, e.g. ["Hello ", 0, " world"]
+ContentParts: TypeAlias = list[str | int]
+
 
-@dataclass
+@dataclass(slots=True)
 class DirectiveMatch:
     """
     Result of finding a directive pattern in source text
@@ -36,12 +42,12 @@ class DirectiveMatch:
     position: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedContent:
     """
-    Result of recursively processing directive content
+    Result of processing directive content
 
-    Returned by Parser.content_processRecursive() after extracting nested
+    Returned by Parser.content_process() after extracting nested
     directives and modifiers from a directive's content string.
 
     Attributes:
@@ -51,6 +57,8 @@ class ProcessedContent:
                   placeholders (CHILD_0 → children[0])
         modifiers: Extracted modifier directives (.style{}, .class{}) as dict
                    (e.g., {"style": "color: red", "class": "highlight"})
+        parts: Content split into text runs and child indices, or None
+               when there are no children (e.g., ["Hello ", 0, ""])
 
     Example:
         Input content: ".style{color:red} Hello .bf{world}"
@@ -64,9 +72,42 @@ class ProcessedContent:
     content: str
     children: list["ASTNode"]  # Forward reference for type checking
     modifiers: Modifiers
+    parts: ContentParts | None = None
+
+
+@dataclass(slots=True)
+class ContentFrame:
+    """
+    One directive body on Parser.content_process()'s work stack
+
+    The body is the span source[pos:end]; nested directives are found and
+    pushed as frames of their own, so nesting depth costs stack entries
+    rather than Python call frames.
+
+    Attributes:
+        directive: Name of the directive owning this body ("" for the root)
+        start: Index of the directive's "." in the enclosing body
+        end: Index of the body's closing brace (end of the scanned span)
+        pos: Scan position within the body
+        segment_start: Start of the text not yet copied into segments
+        modifiers: Modifiers found at the start of the body
+        segments: Text runs and child placeholders collected so far
+        parts: The same text runs with child indices for placeholders
+        children: Child nodes built so far, indexed like the placeholders
+    """
+
+    directive: str
+    start: int
+    end: int
+    pos: int
+    segment_start: int
+    modifiers: Modifiers
+    segments: list[str] = field(default_factory=list)
+    parts: ContentParts = field(default_factory=list)
+    children: list["ASTNode"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedModifiers:
     """
     Result of extracting modifier directives from content start
@@ -96,3 +137,48 @@ class ExtractedModifiers:
 
     modifiers: Modifiers
     remaining: str
+
+
+@dataclass(frozen=True, slots=True)
+class ParseResult:
+    r"""
+    Everything a parse produces, detached from the Parser that made it
+
+    Returned by Parser.parse_result(). The compiler accepts it in place of
+    an AST plus separate placeholder maps, so callers need not keep the
+    parser around (or can reset and reuse it) once parsing is done.
+
+    Attributes:
+        ast: Top-level AST nodes
+        protected_code_blocks: Raw .code{} content by CODE placeholder ID
+        escaped_sequences: Literal escaped text by ESCAPE placeholder ID
+
+    Example:
+        Input source: r".slide{.body{Use \.bf\{x\}}}"
+        Result: ParseResult(
+            ast=[ASTNode(directive="slide", ...)],
+            protected_code_blocks={},
+            escaped_sequences={0: ".bf{x}"}
+        )
+    """
+
+    ast: list["ASTNode"]  # Forward reference for type checking
+    protected_code_blocks: PlaceholderMap
+    escaped_sequences: PlaceholderMap
+
+    def clone(self) -> "ParseResult":
+        """
+        Return a copy that shares no mutable state with this result
+
+        Compiling may add entries to the placeholder maps (included files)
+        and rewrite included nodes, so a result kept for reuse hands each
+        compile its own copy; cloning is far cheaper than parsing again.
+
+        Returns:
+            ParseResult with cloned nodes and fresh placeholder maps
+        """
+        return ParseResult(
+            ast=[node.clone() for node in self.ast],
+            protected_code_blocks=dict(self.protected_code_blocks),
+            escaped_sequences=dict(self.escaped_sequences),
+        )
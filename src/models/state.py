@@ -7,7 +7,7 @@ the pipeline() helper for composing transformation stages.
 
 from argparse import Namespace
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
 from typing import TYPE_CHECKING, TypeVar
 
@@ -20,7 +20,28 @@ from .compiler import CompileResult, PlaceholderMap
 PS = TypeVar("PS", bound="ProgramState")
 
 
-@dataclass
+# Field names per dataclass type, filled on first use by fieldNames_get()
+_field_names: dict[type, frozenset[str]] = {}
+
+
+def fieldNames_get(cls: type) -> frozenset[str]:
+    """
+    Return the (cached) set of field names declared by a dataclass.
+
+    Args:
+        cls: Dataclass type to inspect
+
+    Returns:
+        Frozen set of the dataclass's field names
+    """
+    names: frozenset[str] | None = _field_names.get(cls)
+    if names is None:
+        names = frozenset(f.name for f in fields(cls))
+        _field_names[cls] = names
+    return names
+
+
+@dataclass(slots=True)
 class ProgramState:
     """
     Central state container for the compilation pipeline (state bus pattern).
@@ -102,9 +123,7 @@ class ProgramState:
         options_dict = vars(options)
 
         # Get the set of valid field names for ProgramState
-        import dataclasses
-
-        valid_fields = {f.name for f in dataclasses.fields(cls)}
+        valid_fields: frozenset[str] = fieldNames_get(cls)
 
         # Filter options_dict to only include fields that exist in ProgramState
         filtered_options = {
@@ -129,7 +148,7 @@ class ProgramState:
         Returns:
             A new ProgramState instance.
         """
-        return type(self)(**self.__dict__)
+        return replace(self)
 
 
 def pipeline(
@@ -163,6 +182,7 @@ def pipeline(
 
     But reads left-to-right instead of inside-out.
     """
-    from functools import reduce
-
-    return reduce(lambda state, stage: stage(state), stages, initial_state)
+    state: ProgramState = initial_state
+    for stage in stages:
+        state = stage(state)
+    return state
@@ -0,0 +1,95 @@
+"""
+Shared test fixtures
+
+Hands out ASTs through Parser.parse_cached so tests compiling the same
+slidedown source do not re-run the parser for it; tests that want runtime
+assets hardlinked rather than copied ask for ``assets_linked``. Parser-level
+tests can share one reset Parser through ``parser_reused``. Compiled
+HTML can be checked against the golden files in ``tests/fixtures``; run
+pytest with ``--update-fixtures`` to rewrite them after an intended
+output change.
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from slidedown.config import appsettings
+from slidedown.lib.parser import ASTNode, Parser
+
+FIXTURES_DIR: Path = Path(__file__).resolve().parent / "fixtures"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register ``--update-fixtures`` for regenerating golden HTML"""
+    parser.addoption(
+        "--update-fixtures",
+        action="store_true",
+        default=False,
+        help="rewrite tests/fixtures/*.html from the current compiler output",
+    )
+
+
+@pytest.fixture
+def assets_linked(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Hardlink compiler assets into the output for this test only"""
+    monkeypatch.setattr(appsettings, "link_assets", True)
+
+
+@pytest.fixture
+def parse_cached() -> Callable[[str], list[ASTNode]]:
+    """
+    Parse slidedown source through the process-wide parse cache
+
+    Each call returns a private deep copy of the cached AST, so a compiler
+    mutating nodes cannot leak state into another test.
+    """
+
+    def parse(source: str) -> list[ASTNode]:
+        return Parser.parse_cached(source).ast
+
+    return parse
+
+
+@pytest.fixture(scope="session")
+def parser_pooled() -> Parser:
+    """One Parser (and directive registry) shared by the whole session"""
+    return Parser("")
+
+
+@pytest.fixture
+def parser_reused(parser_pooled: Parser) -> Callable[[str], Parser]:
+    """
+    Hand out the session's pooled parser, reset to a new source
+
+    Saves building a DirectiveRegistry per test. Each call rebinds the
+    parser's results, so ASTs from an earlier call stay intact.
+    """
+
+    def parser_for(source: str) -> Parser:
+        parser_pooled.reset(source)
+        return parser_pooled
+
+    return parser_for
+
+
+@pytest.fixture
+def golden_html(request: pytest.FixtureRequest) -> Callable[[str, str], None]:
+    """
+    Compare compiled HTML against ``tests/fixtures/<name>.html``
+
+    The whole document is checked with a single equality, so any change in
+    the output fails the test. With ``--update-fixtures`` the golden file is
+    written from ``html`` instead.
+    """
+    update: bool = request.config.getoption("--update-fixtures")
+
+    def check(name: str, html: str) -> None:
+        golden: Path = FIXTURES_DIR / f"{name}.html"
+        if update:
+            FIXTURES_DIR.mkdir(exist_ok=True)
+            golden.write_text(html, encoding="utf-8")
+            return
+        assert html == golden.read_text(encoding="utf-8")
+
+    return check
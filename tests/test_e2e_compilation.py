@@ -7,19 +7,81 @@ Validates that complete slide presentations with real directives compile
 correctly and produce expected HTML structures.
 """
 
-import tempfile
+import os
+import re
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 
+import pytest
 from pytest import MonkeyPatch
 from slidedown.lib import compiler_rendering
 from slidedown.lib.compiler import Compiler
-from slidedown.lib.parser import Parser
+from slidedown.lib.parser import ASTNode
+
+PACKAGE_ROOT: Path = Path(__file__).resolve().parent.parent
+ASSETS_DIR: str = str(PACKAGE_ROOT / "assets")
+
+# Signature of the ``parse_cached`` fixture from conftest.py
+ParseCached = Callable[[str], list[ASTNode]]
+# Signature of the ``golden_html`` fixture from conftest.py
+GoldenHTML = Callable[[str, str], None]
+
+
+@lru_cache(maxsize=64)
+def _needles_pattern(needles: tuple[str, ...]) -> re.Pattern[str]:
+    """Alternation of ``needles``, longest first, compiled once per set."""
+    return re.compile(
+        "|".join(re.escape(n) for n in sorted(set(needles), key=len)[::-1])
+    )
+
+
+def assert_all_in(html: str, needles: list[str] | tuple[str, ...]) -> None:
+    """
+    Assert that every needle occurs in ``html``
+
+    Scans the HTML once with an alternation of all needles, longest first.
+    A needle that overlaps another needle's match is re-checked directly,
+    so this is exactly as strict as one ``in`` check per needle.
+    """
+    pattern = _needles_pattern(tuple(needles))
+    found = set(pattern.findall(html))
+    missing = [n for n in needles if n not in found and n not in html]
+    assert not missing, f"missing from HTML: {missing}"
+
+
+def _read_html(output_dir: str | Path) -> str:
+    """Read the compiled ``index.html`` from ``output_dir``."""
+    with open(os.path.join(output_dir, "index.html"), encoding="utf-8") as f:
+        return f.read()
+
+
+def _compile(
+    ast: list[ASTNode], tmp_path: Path, copy_assets: bool = False
+) -> str:
+    """Compile ``ast`` into ``tmp_path`` and return the generated HTML."""
+    compiler = Compiler(
+        ast=ast,
+        output_dir=str(tmp_path),
+        assets_dir=ASSETS_DIR,
+        verbosity=0,
+        copy_assets=copy_assets,
+    )
+    result = compiler.compile()
+
+    assert result["status"] is True
+    return _read_html(tmp_path)
 
 
 class TestBasicSlideCompilation:
     """Test complete slide compilation"""
 
-    def test_single_slide_with_title_and_body(self) -> None:
+    def test_single_slide_with_title_and_body(
+        self,
+        tmp_path: Path,
+        parse_cached: ParseCached,
+        golden_html: GoldenHTML,
+    ) -> None:
         """Compile simple slide with title and body"""
         source = """
 .slide{
@@ -27,38 +89,106 @@ class TestBasicSlideCompilation:
   .body{This is a simple slide.}
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        # Create temporary output directory
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Use package assets
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-            assert result["slide_count"] == 1
-
-            # Verify output file exists
-            output_file = Path(tmpdir) / "index.html"
-            assert output_file.exists()
-
-            # Verify HTML content
-            html = output_file.read_text()
-            assert '<div class="container slide"' in html
-            assert 'id="slide-1"' in html
-            assert "Welcome to Slidedown" in html
-            assert "This is a simple slide." in html
-
-    def test_multiple_slides(self) -> None:
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
+
+        assert result["status"] is True
+        assert result["slide_count"] == 1
+
+        # Asset copying was switched off
+        assert not (tmp_path / "css").exists()
+
+        # Verify HTML content (reading fails if the file was not written)
+        golden_html("single_slide", _read_html(tmp_path))
+
+    @pytest.mark.usefixtures("assets_linked")
+    def test_recompile_into_same_output_dir(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
+        """Rebuilding over earlier output replaces, not edits, the assets"""
+        ast = parse_cached(".slide{.title{Again} .body{Twice}}")
+        source_css = Path(ASSETS_DIR) / "css" / "slidedown.css"
+        source_text = source_css.read_text()
+
+        for _ in range(2):
+            fresh = [node.clone() for node in ast]
+            html = _compile(fresh, tmp_path, copy_assets=True)
+
+        assert "Twice" in html
+        assert source_css.read_text() == source_text
+        assert (tmp_path / "css" / "slidedown.css").read_text() == source_text
+
+    def test_assets_copied_by_default(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
+        """Without link_assets, output assets are independent copies"""
+        ast = parse_cached(".slide{.title{Copy} .body{Default}}")
+        source_css = Path(ASSETS_DIR) / "css" / "slidedown.css"
+
+        _compile([node.clone() for node in ast], tmp_path, copy_assets=True)
+
+        output_css = tmp_path / "css" / "slidedown.css"
+        assert output_css.read_bytes() == source_css.read_bytes()
+        assert not output_css.samefile(source_css)
+
+    @pytest.mark.usefixtures("assets_linked")
+    def test_assets_linked_when_enabled(
+        self,
+        tmp_path: Path,
+        parse_cached: ParseCached,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """With link_assets, output assets are hardlinked from the sources"""
+        linked: list[Path] = []
+        link = os.link
+
+        def link_recorded(src: str | Path, dst: str | Path) -> None:
+            linked.append(Path(dst))
+            link(src, dst)
+
+        monkeypatch.setattr(os, "link", link_recorded)
+        ast = parse_cached(".slide{.title{Link} .body{Enabled}}")
+
+        _compile([node.clone() for node in ast], tmp_path, copy_assets=True)
+
+        assert tmp_path / "css" / "slidedown.css" in linked
+
+    @pytest.mark.usefixtures("assets_linked")
+    def test_assets_copied_when_linking_fails(
+        self,
+        tmp_path: Path,
+        parse_cached: ParseCached,
+        monkeypatch: MonkeyPatch,
+    ) -> None:
+        """A filesystem refusing hardlinks falls back to copying"""
+
+        def link_refused(src: str | Path, dst: str | Path) -> None:
+            raise OSError("cross-device link")
+
+        monkeypatch.setattr(os, "link", link_refused)
+        ast = parse_cached(".slide{.title{Link} .body{Refused}}")
+        source_css = Path(ASSETS_DIR) / "css" / "slidedown.css"
+
+        _compile([node.clone() for node in ast], tmp_path, copy_assets=True)
+
+        output_css = tmp_path / "css" / "slidedown.css"
+        assert output_css.read_bytes() == source_css.read_bytes()
+        assert not output_css.samefile(source_css)
+
+    def test_multiple_slides(
+        self,
+        tmp_path: Path,
+        parse_cached: ParseCached,
+        golden_html: GoldenHTML,
+    ) -> None:
         """Compile presentation with multiple slides"""
         source = """
 .slide{
@@ -76,33 +206,26 @@ class TestBasicSlideCompilation:
   .body{Third slide content}
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
-
-            assert result["slide_count"] == 3
-
-            html = (Path(tmpdir) / "index.html").read_text()
-            assert 'id="slide-1"' in html
-            assert 'id="slide-2"' in html
-            assert 'id="slide-3"' in html
-            assert "Slide 1" in html
-            assert "Slide 2" in html
-            assert "Slide 3" in html
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
+
+        assert result["slide_count"] == 3
+
+        golden_html("multiple_slides", _read_html(tmp_path))
 
     def test_lcars_frame_renders_build_info(
-        self, monkeypatch: MonkeyPatch
+        self,
+        tmp_path: Path,
+        parse_cached: ParseCached,
+        monkeypatch: MonkeyPatch,
     ) -> None:
         """Compile LCARS theme with version and commit metadata panel."""
         source = """
@@ -111,8 +234,7 @@ class TestBasicSlideCompilation:
   .body{Build metadata should render in a side panel.}
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
+        ast = parse_cached(source)
 
         monkeypatch.setattr(
             compiler_rendering,
@@ -124,29 +246,28 @@ class TestBasicSlideCompilation:
             },
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-                theme_name="lcars-lower-decks",
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-
-            html = (Path(tmpdir) / "index.html").read_text()
-            assert '<div class="panel-3">' in html
-            assert "VER" in html
-            assert "v9.8.7-abcde" in html
-            assert 'id="lcars-date"' in html
-            assert 'id="lcars-time"' in html
-
-    def test_lcars_frame_excludes_bridge_artifacts(self) -> None:
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+            theme_name="lcars-lower-decks",
+        )
+        result = compiler.compile()
+
+        assert result["status"] is True
+
+        html = _read_html(tmp_path)
+        assert '<div class="panel-3">' in html
+        assert "VER" in html
+        assert "v9.8.7-abcde" in html
+        assert 'id="lcars-date"' in html
+        assert 'id="lcars-time"' in html
+
+    def test_lcars_frame_excludes_bridge_artifacts(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Compile LCARS theme without non-upstream bridge artifacts."""
         source = """
 .slide{
@@ -154,54 +275,49 @@ class TestBasicSlideCompilation:
   .body{Bridge telemetry should not be generated.}
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-                theme_name="lcars-lower-decks",
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-
-            html = (Path(tmpdir) / "index.html").read_text()
-            theme_css = (Path(tmpdir) / "css" / "theme.css").read_text()
-            slide_js = (Path(tmpdir) / "js" / "slidedown.js").read_text()
-            lcars_js = (
-                Path(tmpdir) / "js" / "lcars-scripts.js"
-            ).read_text()
-            cascade_js = (
-                Path(tmpdir) / "js" / "slidedown-lcars-cascade.js"
-            ).read_text()
-            compiled_output = "\n".join(
-                [html, theme_css, slide_js, lcars_js, cascade_js]
-            )
-
-            forbidden_fragments = [
-                "BRIDGE_STATE",
-                "High-Fidelity Bridge",
-                "lcars-telemetry-bank",
-                "telemetry-wrapper",
-                "lcars-nerd-graphic",
-                "lcars-flicker",
-                "slide-1-effect",
-                "effect-starmap",
-                "effect-histogram",
-                "effect-waveform",
-                "effect-orbital",
-            ]
-            for fragment in forbidden_fragments:
-                assert fragment not in compiled_output
-
-    def test_lcars_frame_loads_supplemental_cascade_animation(self) -> None:
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            theme_name="lcars-lower-decks",
+        )
+        result = compiler.compile()
+
+        assert result["status"] is True
+
+        html = _read_html(tmp_path)
+        theme_css = (tmp_path / "css" / "theme.css").read_text()
+        slide_js = (tmp_path / "js" / "slidedown.js").read_text()
+        lcars_js = (tmp_path / "js" / "lcars-scripts.js").read_text()
+        cascade_js = (
+            tmp_path / "js" / "slidedown-lcars-cascade.js"
+        ).read_text()
+        compiled_output = "\n".join(
+            [html, theme_css, slide_js, lcars_js, cascade_js]
+        )
+
+        forbidden_fragments = [
+            "BRIDGE_STATE",
+            "High-Fidelity Bridge",
+            "lcars-telemetry-bank",
+            "telemetry-wrapper",
+            "lcars-nerd-graphic",
+            "lcars-flicker",
+            "slide-1-effect",
+            "effect-starmap",
+            "effect-histogram",
+            "effect-waveform",
+            "effect-orbital",
+        ]
+        for fragment in forbidden_fragments:
+            assert fragment not in compiled_output
+
+    def test_lcars_frame_loads_supplemental_cascade_animation(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Compile LCARS theme with supplemental cascade animation."""
         source = """
 .slide{
@@ -209,43 +325,37 @@ class TestBasicSlideCompilation:
   .body{Supplemental LCARS scripts should load separately.}
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-                theme_name="lcars-lower-decks",
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-
-            output_path = Path(tmpdir)
-            html = (output_path / "index.html").read_text()
-            cascade_js_path = (
-                output_path / "js" / "slidedown-lcars-cascade.js"
-            )
-            cascade_template = (
-                package_root
-                / "themes"
-                / "lcars-lower-decks"
-                / "templates"
-                / "lcars-data-cascade.html"
-            ).read_text()
-
-            assert cascade_js_path.exists()
-            assert "slidedown-lcars-cascade.js" in html
-            assert "prefers-reduced-motion" in cascade_js_path.read_text()
-            assert "03</div>" in cascade_template
-
-    def test_slide_class_modifier_renders_density_class(self) -> None:
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            theme_name="lcars-lower-decks",
+        )
+        result = compiler.compile()
+
+        assert result["status"] is True
+
+        html = _read_html(tmp_path)
+        cascade_js_path = tmp_path / "js" / "slidedown-lcars-cascade.js"
+        cascade_template = (
+            PACKAGE_ROOT
+            / "themes"
+            / "lcars-lower-decks"
+            / "templates"
+            / "lcars-data-cascade.html"
+        ).read_text()
+
+        assert cascade_js_path.exists()
+        assert "slidedown-lcars-cascade.js" in html
+        assert "prefers-reduced-motion" in cascade_js_path.read_text()
+        assert "03</div>" in cascade_template
+
+    def test_slide_class_modifier_renders_density_class(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Compile slide class modifier as a slide-level density class."""
         source = """
 .slide{.class{dense}
@@ -253,27 +363,25 @@ class TestBasicSlideCompilation:
   .body{This slide should use density-aware typography.}
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
 
-            assert result["status"] is True
+        assert result["status"] is True
 
-            html = (Path(tmpdir) / "index.html").read_text()
-            assert 'class="container slide dense"' in html
+        html = _read_html(tmp_path)
+        assert 'class="container slide dense"' in html
 
-    def test_explicit_columns_group_survives_blank_lines(self) -> None:
+    def test_explicit_columns_group_survives_blank_lines(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Compile .columns{} as one row even with blank lines between columns."""
         source = """
 .slide{
@@ -291,30 +399,42 @@ class TestBasicSlideCompilation:
   }
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-
-            html = (Path(tmpdir) / "index.html").read_text()
-            assert 'class="columns"' in html
-            assert html.count('class="column"') == 2
-            assert 'class="columns" style="display: flex; gap: 1rem">' in html
-            assert '<div style="display: flex;">\n<div class="column"' not in html
-
-    def test_slide_class_modifier_rejects_unsafe_tokens(self) -> None:
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
+
+        assert result["status"] is True
+
+        html = _read_html(tmp_path)
+        assert 'class="columns"' in html
+        assert html.count('class="column"') == 2
+        assert 'class="columns" style="display: flex; gap: 1rem">' in html
+        assert '<div style="display: flex;">\n<div class="column"' not in html
+
+    def test_unclosed_column_div_passes_through(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
+        """Compile a body whose raw column div is never closed."""
+        source = """
+.slide{
+  .body{<div class="column">Left open}
+}
+"""
+        html = _compile(parse_cached(source), tmp_path)
+
+        assert '<div class="column">Left open' in html
+        assert '<div style="display: flex;">' not in html
+
+    def test_slide_class_modifier_rejects_unsafe_tokens(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Drop invalid class tokens from slide class modifiers."""
         source = """
 .slide{.class{hero "bad injected=1}
@@ -322,28 +442,26 @@ class TestBasicSlideCompilation:
   .body{Only the safe class token should survive.}
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
 
-            assert result["status"] is True
+        assert result["status"] is True
 
-            html = (Path(tmpdir) / "index.html").read_text()
-            assert 'class="container slide hero"' in html
-            assert "injected=1" not in html
+        html = _read_html(tmp_path)
+        assert 'class="container slide hero"' in html
+        assert "injected=1" not in html
 
-    def test_typography_baseline_renders_deck_scale(self) -> None:
+    def test_typography_baseline_renders_deck_scale(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Compile typography baseline as a deck-level scale variable."""
         source = """
 .meta{
@@ -356,27 +474,25 @@ class TestBasicSlideCompilation:
   .body{Deck typography baseline should scale the theme.}
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
 
-            assert result["status"] is True
+        assert result["status"] is True
 
-            html = (Path(tmpdir) / "index.html").read_text()
-            assert "--deck-typography-scale: 1.35;" in html
+        html = _read_html(tmp_path)
+        assert "--deck-typography-scale: 1.35;" in html
 
-    def test_typography_scale_overrides_baseline(self) -> None:
+    def test_typography_scale_overrides_baseline(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Compile explicit typography scale ahead of named baseline."""
         source = """
 .meta{
@@ -390,28 +506,26 @@ class TestBasicSlideCompilation:
   .body{Explicit scale should win over baseline.}
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
 
-            assert result["status"] is True
+        assert result["status"] is True
 
-            html = (Path(tmpdir) / "index.html").read_text()
-            assert "--deck-typography-scale: 1.42;" in html
-            assert "--deck-typography-scale: 0.9;" not in html
+        html = _read_html(tmp_path)
+        assert "--deck-typography-scale: 1.42;" in html
+        assert "--deck-typography-scale: 0.9;" not in html
 
-    def test_lcars_code_blocks_use_typography_scale(self) -> None:
+    def test_lcars_code_blocks_use_typography_scale(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Compile LCARS code block styles with deck typography scaling."""
         source = """
 .meta{
@@ -428,32 +542,29 @@ print("scaled")
   }
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-                theme_name="lcars-lower-decks",
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-
-            html = (Path(tmpdir) / "index.html").read_text()
-            theme_css = (Path(tmpdir) / "css" / "theme.css").read_text()
-            assert "--deck-typography-scale: 1.42;" in html
-            assert ".formLayout code" in theme_css
-            assert ".formLayout .highlight pre" in theme_css
-            assert "var(--deck-typography-scale, 1)" in theme_css
-
-    def test_snippet_marker_renders_deck_variable(self) -> None:
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            theme_name="lcars-lower-decks",
+        )
+        result = compiler.compile()
+
+        assert result["status"] is True
+
+        html = _read_html(tmp_path)
+        theme_css = (tmp_path / "css" / "theme.css").read_text()
+        assert "--deck-typography-scale: 1.42;" in html
+        assert ".formLayout code" in theme_css
+        assert ".formLayout .highlight pre" in theme_css
+        assert "var(--deck-typography-scale, 1)" in theme_css
+
+    def test_snippet_marker_renders_deck_variable(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Compile snippet marker metadata as a deck-level CSS variable."""
         source = """
 .meta{
@@ -468,27 +579,25 @@ print("scaled")
   }
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
 
-            assert result["status"] is True
+        assert result["status"] is True
 
-            html = (Path(tmpdir) / "index.html").read_text()
-            assert '--snippet-marker: "▶ ";' in html
+        html = _read_html(tmp_path)
+        assert '--snippet-marker: "▶ ";' in html
 
-    def test_snippet_marker_escapes_css_string(self) -> None:
+    def test_snippet_marker_escapes_css_string(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Escape snippet marker text before emitting CSS string values."""
         source = r"""
 .meta{
@@ -503,31 +612,29 @@ print("scaled")
   }
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
 
-            assert result["status"] is True
+        assert result["status"] is True
 
-            html = (Path(tmpdir) / "index.html").read_text()
-            assert '--snippet-marker: "\\"";' in html
+        html = _read_html(tmp_path)
+        assert '--snippet-marker: "\\"";' in html
 
 
 class TestTypewriterEffect:
     """Test .typewriter{} directive compilation"""
 
-    def test_typewriter_basic(self) -> None:
+    def test_typewriter_basic(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Basic typewriter effect"""
         source = """
 .slide{
@@ -537,30 +644,28 @@ class TestTypewriterEffect:
   }
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
 
-            assert result["status"] is True
+        assert result["status"] is True
 
-            html = (Path(tmpdir) / "index.html").read_text()
+        html = _read_html(tmp_path)
 
-            # Check for typewriter element (ID numbering starts at 0 currently)
-            assert 'id="typewriter-' in html
-            assert "This text appears character by character" in html
+        # Check for typewriter element (ID numbering starts at 0 currently)
+        assert 'id="typewriter-' in html
+        assert "This text appears character by character" in html
 
-    def test_typewriter_with_modifiers(self) -> None:
+    def test_typewriter_with_modifiers(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Typewriter with style modifier"""
         source = """
 .slide{
@@ -573,36 +678,55 @@ class TestTypewriterEffect:
   }
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
+
+        assert result["status"] is True
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
+        html = _read_html(tmp_path)
 
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
+        # Should have typewriter element with style
+        assert 'id="typewriter-' in html
+        assert 'style="color: green; font-family: monospace"' in html
 
-            assert result["status"] is True
+    def test_typewriter_backslash_escapes(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
+        """Backslash escapes in typewriter text become literal characters"""
+        source = r".slide{.body{.typewriter{a \> b \\ c \\> d \x}}}"
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
 
-            html = (Path(tmpdir) / "index.html").read_text()
+        assert result["status"] is True
 
-            # Should have typewriter element with style
-            assert 'id="typewriter-' in html
-            assert 'style="color: green; font-family: monospace"' in html
+        html = _read_html(tmp_path)
+        assert r'data-text="a &gt; b \ c \&gt; d \x"' in html
 
 
 class TestSnippetBullets:
     """Test .o{} snippet/bullet directive compilation"""
 
-    def test_simple_bullets(self) -> None:
-        """Simple progressive reveal bullets"""
-        source = """
+    @pytest.mark.parametrize(
+        ("source", "needles"),
+        [
+            pytest.param(
+                """
 .slide{
   .title{Bullet Points}
   .body{
@@ -611,37 +735,20 @@ class TestSnippetBullets:
     .o{Third bullet}
   }
 }
-"""
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-
-            html = (Path(tmpdir) / "index.html").read_text()
-
-            # Check for snippet elements
-            # Note: ID numbering may start at 0 or vary based on implementation
-            assert 'class="snippet sl-hidden"' in html
-            assert 'id="order-' in html  # Snippets exist
-            assert "First bullet" in html
-            assert "Second bullet" in html
-            assert "Third bullet" in html
-
-    def test_nested_formatting_in_bullets(self) -> None:
-        """Bullets with nested formatting directives"""
-        source = """
+""",
+                (
+                    # Note: ID numbering may start at 0 or vary based on
+                    # implementation
+                    'class="snippet sl-hidden"',
+                    'id="order-',
+                    "First bullet",
+                    "Second bullet",
+                    "Third bullet",
+                ),
+                id="simple_bullets",
+            ),
+            pytest.param(
+                """
 .slide{
   .body{
     .o{.bf{Bold} text in bullet}
@@ -649,34 +756,16 @@ class TestSnippetBullets:
     .o{.tt{Monospace} and .bf{bold} together}
   }
 }
-"""
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-
-            html = (Path(tmpdir) / "index.html").read_text()
-
-            # Should have HTML tags for formatting
-            assert "<strong>Bold</strong>" in html
-            assert "<em>Italic</em>" in html
-            assert "<tt>Monospace</tt>" in html
-
-    def test_bullets_across_multiple_slides(self) -> None:
-        """Snippet numbering resets per slide"""
-        source = """
+""",
+                (
+                    "<strong>Bold</strong>",
+                    "<em>Italic</em>",
+                    "<tt>Monospace</tt>",
+                ),
+                id="nested_formatting_in_bullets",
+            ),
+            pytest.param(
+                """
 .slide{
   .body{
     .o{Slide 1, bullet 1}
@@ -690,222 +779,134 @@ class TestSnippetBullets:
     .o{Slide 2, bullet 2}
   }
 }
-"""
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-
-            html = (Path(tmpdir) / "index.html").read_text()
-
-            # Both slides have snippets
-            assert 'class="snippet sl-hidden"' in html
+""",
+                (
+                    'class="snippet sl-hidden"',
+                    "Slide 1, bullet 1",
+                    "Slide 1, bullet 2",
+                    "Slide 2, bullet 1",
+                    "Slide 2, bullet 2",
+                ),
+                id="bullets_across_multiple_slides",
+            ),
+        ],
+    )
+    def test_bullets(
+        self,
+        source: str,
+        needles: tuple[str, ...],
+        tmp_path: Path,
+        parse_cached: ParseCached,
+    ) -> None:
+        """Bullets compile to hidden snippets carrying their content"""
+        html = _compile(parse_cached(source), tmp_path)
 
-            # Content is present
-            assert "Slide 1, bullet 1" in html
-            assert "Slide 1, bullet 2" in html
-            assert "Slide 2, bullet 1" in html
-            assert "Slide 2, bullet 2" in html
+        assert_all_in(html, needles)
 
 
 class TestFormattingDirectives:
     """Test text formatting directives (.bf, .em, .tt, etc.)"""
 
-    def test_bold_formatting(self) -> None:
-        """Bold text formatting"""
-        source = """
-.slide{
-  .body{This is .bf{bold text} in a sentence.}
-}
-"""
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-
-            html = (Path(tmpdir) / "index.html").read_text()
-            assert "<strong>bold text</strong>" in html
-
-    def test_italic_formatting(self) -> None:
-        """Italic text formatting"""
-        source = """
-.slide{
-  .body{This is .em{emphasized text} in a sentence.}
-}
-"""
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-
-            html = (Path(tmpdir) / "index.html").read_text()
-            assert "<em>emphasized text</em>" in html
-
-    def test_monospace_formatting(self) -> None:
-        """Monospace/teletype formatting"""
-        source = """
-.slide{
-  .body{Code: .tt{function() { return 42; }}}
-}
-"""
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-
-            html = (Path(tmpdir) / "index.html").read_text()
-            assert "<tt>function() { return 42; }</tt>" in html
-
-    def test_nested_formatting(self) -> None:
-        """Nested formatting directives"""
-        source = """
-.slide{
-  .body{.bf{This is .em{bold and italic} text}}
-}
-"""
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
+    @pytest.mark.parametrize(
+        "source",
+        [
+            pytest.param(
+                ".slide{\n  .body{This is .bf{bold text} in a sentence.}\n}",
+                id="bold",
+            ),
+            pytest.param(
+                ".slide{\n  .body{This is .em{emphasized text} in a "
+                "sentence.}\n}",
+                id="italic",
+            ),
+            pytest.param(
+                ".slide{\n  .body{Code: .tt{function() { return 42; }}}\n}",
+                id="monospace",
+            ),
+            pytest.param(
+                # Should have nested tags
+                ".slide{\n  .body{.bf{This is .em{bold and italic} "
+                "text}}\n}",
+                id="nested",
+            ),
+        ],
+    )
+    def test_formatting(
+        self,
+        source: str,
+        request: pytest.FixtureRequest,
+        tmp_path: Path,
+        parse_cached: ParseCached,
+        golden_html: GoldenHTML,
+    ) -> None:
+        """Formatting directives compile to their inline HTML tags"""
+        html = _compile(parse_cached(source), tmp_path)
 
-            html = (Path(tmpdir) / "index.html").read_text()
-            # Should have nested tags
-            assert "<strong>" in html
-            assert "<em>bold and italic</em>" in html
+        golden_html(f"formatting_{request.node.callspec.id}", html)
 
 
 class TestASCIIArtDirectives:
     """Test ASCII art transformation directives"""
 
-    def test_figlet_font(self) -> None:
+    def test_figlet_font(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Figlet ASCII art with font-* directive"""
-        source = """
-.slide{
-  .body{
-    .font-standard{HELLO}
-  }
-}
-"""
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-
-            html = (Path(tmpdir) / "index.html").read_text()
-            # Figlet output wrapped in <pre class="figlet-art">
-            assert '<pre class="figlet-art">' in html
-            # ASCII art will contain ASCII representation of letters
-            # Check for underscores/pipes from rendered ASCII output.
-            assert ("_" in html and "|" in html) or "HELLO" in html
-
-    def test_cowsay_character(self) -> None:
-        """Cowsay speech bubble with cowpy-* directive"""
-        source = """
-.slide{
-  .body{
-    .cowpy-cow{Hello from the cow!}
-  }
-}
-"""
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
+        html = _compile(
+            parse_cached(
+                ".slide{\n  .body{\n    .font-standard{HELLO}\n  }\n}"
+            ),
+            tmp_path,
+        )
 
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
+        # Figlet output wrapped in <pre class="figlet-art">
+        assert '<pre class="figlet-art">' in html
+        # ASCII art will contain ASCII representation of letters
+        # Check for underscores/pipes from rendered ASCII output.
+        assert ("_" in html and "|" in html) or "HELLO" in html
 
-            assert result["status"] is True
+    def test_cowsay_character(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
+        """Cowsay speech bubble with cowpy-* directive"""
+        html = _compile(
+            parse_cached(
+                ".slide{\n  .body{\n"
+                "    .cowpy-cow{Hello from the cow!}\n  }\n}"
+            ),
+            tmp_path,
+        )
 
-            html = (Path(tmpdir) / "index.html").read_text()
-            # Cowsay output wrapped in <pre>
-            assert "<pre>" in html
-            assert "Hello from the cow!" in html
+        # Cowsay output wrapped in <pre>
+        assert "<pre>" in html
+        assert "Hello from the cow!" in html
 
 
 class TestComplexSlide:
     """Test complex real-world slide with multiple features"""
 
-    def test_comprehensive_slide(self) -> None:
+    # Everything the comprehensive slide must contribute to the HTML
+    COMPREHENSIVE_NEEDLES: tuple[str, ...] = (
+        # Slide has style attribute
+        'style="display:none; background: black; color: lightgreen;"',
+        # Contains typewriter
+        'id="typewriter-',
+        # Contains snippets
+        'class="snippet sl-hidden"',
+        'id="order-',
+        # Contains formatting
+        "<em>",
+        "<tt>",
+        "<strong>",
+        # Contains content
+        "Text-first",
+        "Behavioral",
+        "Made with slidedown!",
+    )
+
+    def test_comprehensive_slide(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Slide with modifiers, typewriter, bullets, formatting, and art"""
         source = """
 .slide{.style{background: black; color: lightgreen;}
@@ -923,8 +924,7 @@ class TestComplexSlide:
   }
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
+        ast = parse_cached(source)
 
         # Validate AST structure
         assert len(ast) == 1
@@ -935,51 +935,29 @@ class TestComplexSlide:
             slide.modifiers["style"] == "background: black; color: lightgreen;"
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-            assert result["slide_count"] == 1
-
-            html = (Path(tmpdir) / "index.html").read_text()
-
-            # Slide has style attribute
-            assert (
-                'style="display:none; background: black; color: lightgreen;"'
-                in html
-            )
-
-            # Contains typewriter
-            assert 'id="typewriter-' in html
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
 
-            # Contains snippets
-            assert 'class="snippet sl-hidden"' in html
-            assert 'id="order-' in html
+        assert result["status"] is True
+        assert result["slide_count"] == 1
 
-            # Contains formatting
-            assert "<em>" in html
-            assert "<tt>" in html
-            assert "<strong>" in html
+        html = _read_html(tmp_path)
 
-            # Contains content
-            assert "Text-first" in html
-            assert "Behavioral" in html
-            assert "Made with slidedown!" in html
+        assert_all_in(html, self.COMPREHENSIVE_NEEDLES)
 
 
 class TestHTMLPassthrough:
     """Test that raw HTML is preserved"""
 
-    def test_html_in_body(self) -> None:
+    def test_html_in_body(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Raw HTML tags in body content"""
         source = """
 .slide{
@@ -992,35 +970,36 @@ class TestHTMLPassthrough:
   }
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
 
-            assert result["status"] is True
+        assert result["status"] is True
 
-            html = (Path(tmpdir) / "index.html").read_text()
+        html = _read_html(tmp_path)
 
-            # HTML should be preserved as-is
-            assert "<h1>HTML Heading</h1>" in html
-            assert (
+        # HTML should be preserved as-is
+        assert_all_in(
+            html,
+            [
+                "<h1>HTML Heading</h1>",
                 '<p>This is a <span style="color: red;">colored</span> '
-                "paragraph.</p>"
-            ) in html
-            assert "<ul>" in html
-            assert "<li>HTML list item</li>" in html
+                "paragraph.</p>",
+                "<ul>",
+                "<li>HTML list item</li>",
+            ],
+        )
 
-    def test_mixed_directives_and_html(self) -> None:
+    def test_mixed_directives_and_html(
+        self, tmp_path: Path, parse_cached: ParseCached
+    ) -> None:
         """Mix of directives and raw HTML"""
         source = """
 .slide{
@@ -1033,29 +1012,23 @@ class TestHTMLPassthrough:
   }
 }
 """
-        parser = Parser(source)
-        ast = parser.parse()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            package_root = Path(__file__).parent.parent
-            assets_dir = package_root / "assets"
-
-            compiler = Compiler(
-                ast=ast,
-                output_dir=tmpdir,
-                assets_dir=str(assets_dir),
-                verbosity=0,
-            )
-            result = compiler.compile()
-
-            assert result["status"] is True
-
-            html = (Path(tmpdir) / "index.html").read_text()
-
-            # Both directive output and raw HTML present
-            assert (
-                "<strong>Slidedown directives</strong>" in html
-            )  # From .bf{}
-            assert "<strong>HTML tags</strong>" in html  # Raw HTML
-            assert '<div class="custom-container">' in html
-            assert "<em>Emphasized</em>" in html  # From .em{}
+        ast = parse_cached(source)
+
+        compiler = Compiler(
+            ast=ast,
+            output_dir=str(tmp_path),
+            assets_dir=ASSETS_DIR,
+            verbosity=0,
+            copy_assets=False,
+        )
+        result = compiler.compile()
+
+        assert result["status"] is True
+
+        html = _read_html(tmp_path)
+
+        # Both directive output and raw HTML present
+        assert "<strong>Slidedown directives</strong>" in html  # From .bf{}
+        assert "<strong>HTML tags</strong>" in html  # Raw HTML
+        assert '<div class="custom-container">' in html
+        assert "<em>Emphasized</em>" in html  # From .em{}
@@ -8,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from slidedown.lib.compiler import Compiler
+from slidedown.lib.directives import _ast_rebaseEscapeIDs
 from slidedown.lib.parser import Parser
 
 
@@ -164,6 +165,47 @@ class TestIncludeDirective:
         assert "From child file" in html
         assert "First slide" in html
 
+    def test_include_rebases_placeholders(self) -> None:
+        """Escapes and code blocks keep their own text on both sides."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            child = Path(tmpdir) / "child.sd"
+            child.write_text(
+                ".slide{\n  .body{.o{Child \\.bf\\{esc\\}}\n"
+                "  .code{.syntax{python}\nchild_code = 2\n}}\n}\n"
+            )
+            parent_source = (
+                ".slide{\n  .body{Parent \\.tt\\{esc\\}\n"
+                "  .code{.syntax{python}\nparent_code = 1\n}}\n}\n"
+                ".include{child.sd}\n"
+            )
+            html = _compile(parent_source, tmpdir)
+        assert ".tt{esc}" in html
+        assert ".bf{esc}" in html
+        assert "parent_code" in html
+        assert "child_code" in html
+
+    def test_rebase_matches_fresh_parse(self, tmp_path: Path) -> None:
+        """A rebased node splits and compiles like one parsed at that ID."""
+        node = Parser(r".body{\.o\{x\} .bf{bold} tail}").parse()[0]
+        _ast_rebaseEscapeIDs([node], 3)
+
+        # Three earlier escapes give the body's escape ID 3 directly
+        fresh_parser = Parser(
+            r"\.a\{\} \.b\{\} \.c\{\} .body{\.o\{x\} .bf{bold} tail}"
+        )
+        fresh = fresh_parser.parse()[0]
+        compiler = Compiler(
+            ast=[],
+            output_dir=str(tmp_path),
+            assets_dir="assets",
+            verbosity=0,
+            escaped_sequences=fresh_parser.escaped_sequences,
+        )
+
+        assert node.content == fresh.content
+        assert node.parts() == fresh.parts()
+        assert compiler.node_compile(node) == compiler.node_compile(fresh)
+
     def test_include_slide_count_continues(self) -> None:
         """Slide counter continues across the include boundary."""
         with tempfile.TemporaryDirectory() as tmpdir:
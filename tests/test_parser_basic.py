@@ -4,8 +4,18 @@ Basic parser tests - simplest cases
 Tests empty source, single directives, and plain text.
 """
 
+from pathlib import Path
+
 import pytest
-from slidedown.lib.parser import Parser
+from slidedown.config import appsettings
+from slidedown.lib.compiler import Compiler
+from slidedown.lib.parser import (
+    PARSE_CACHE_MAX_SOURCE,
+    Parser,
+    _source_parsed,
+    braceClose_find,
+    bracePairs_map,
+)
 
 
 class TestEmptyAndSimple:
@@ -122,6 +132,161 @@ class TestBraceHandling:
         # Should parse first directive successfully, ignore extra }
         assert len(nodes) == 1
 
+    def test_braceClose_find(self) -> None:
+        """Closing brace lookup honours nesting and reports unmatched"""
+        text = "{a{b}{c{d}}e}f}"
+
+        assert braceClose_find(text, 0) == 12
+        assert braceClose_find(text, 2) == 4
+        assert braceClose_find(text, 5) == 10
+        assert braceClose_find("{a{b}", 0) == -1
+        assert braceClose_find("{", 0) == -1
+
+    def test_bracePairs_map_agrees_with_braceClose_find(self) -> None:
+        """One-pass pairing matches the per-brace lookup, unclosed omitted"""
+        text = "}{a{b}{c{d}}e}f}{g{h}"
+        pairs = bracePairs_map(text)
+
+        for pos, char in enumerate(text):
+            if char == "{":
+                assert pairs.get(pos, -1) == braceClose_find(text, pos)
+        assert pairs == {1: 13, 3: 5, 6: 11, 8: 10, 18: 20}
+
+
+class TestParseCached:
+    """Test the memoized Parser.parse_cached constructor"""
+
+    def test_matches_fresh_parse(self) -> None:
+        """Cached parse yields the same AST and placeholder maps"""
+        source = (
+            ".slide{.code{.syntax{language=python}\nx = 1\n} \\.bf\\{x\\}}"
+        )
+        fresh = Parser(source)
+        nodes = fresh.parse()
+
+        cached = Parser.parse_cached(source)
+
+        assert cached.ast == nodes
+        assert cached.protected_code_blocks == fresh.protected_code_blocks
+        assert cached.escaped_sequences == fresh.escaped_sequences
+        assert cached.escaped_sequences == {0: ".bf{x}"}
+
+    def test_returns_independent_copies(self) -> None:
+        """Mutating one cached result does not leak into the next"""
+        first = Parser.parse_cached(".slide{.bf{bold}}")
+        first.ast[0].children[0].content = "changed"
+        first.escaped_sequences[99] = "changed"
+
+        second = Parser.parse_cached(".slide{.bf{bold}}")
+
+        assert second.ast[0].children[0].content == "bold"
+        assert 99 not in second.escaped_sequences
+
+    def test_clone_shares_no_mutable_state(self) -> None:
+        """ASTNode.clone copies the whole subtree, modifiers included"""
+        node = Parser(".slide{.style{color: red} .bf{bold}}").parse()[0]
+        copied = node.clone()
+
+        assert copied == node
+        copied.modifiers["style"] = "changed"
+        copied.children[0].content = "changed"
+
+        assert node.modifiers == {"style": "color: red"}
+        assert node.children[0].content == "bold"
+
+    def test_nodes_are_slotted(self) -> None:
+        """AST nodes carry no per-instance __dict__"""
+        node = Parser(".slide{.bf{bold}}").parse()[0]
+
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            node.extra = True  # type: ignore[attr-defined]
+
+    def test_cache_follows_placeholder_settings(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Changing the placeholder format is not served a stale parse"""
+        source = ".slide{.bf{bold}}"
+        assert Parser.parse_cached(source).ast[0].content == "\x00CHILD_0\x00"
+
+        monkeypatch.setattr(appsettings, "placeholder_prefix", "\x00C")
+
+        assert Parser.parse_cached(source).ast[0].content == "\x00C0\x00"
+
+    def test_large_source_is_not_cached(self) -> None:
+        """Sources over the size limit are parsed without being retained"""
+        body = "x" * PARSE_CACHE_MAX_SOURCE
+        source = f".slide{{.body{{{body}}}}}"
+        cached_before = _source_parsed.cache_info().currsize
+
+        parser = Parser.parse_cached(source)
+
+        assert parser.ast[0].children[0].content == body
+        assert _source_parsed.cache_info().currsize == cached_before
+
+
+class TestParserReset:
+    """Test reusing one Parser for several sources"""
+
+    def test_reset_parses_new_source(self) -> None:
+        """A reset parser parses afresh and leaves earlier results alone"""
+        parser = Parser(r".tt{\.bf\{x\}}")
+        first = parser.parse()
+        first_escapes = parser.escaped_sequences
+
+        parser.reset(".slide{.bf{bold}}")
+        second = parser.parse()
+
+        assert first[0].directive == "tt"
+        assert first_escapes == {0: ".bf{x}"}
+        assert parser.escaped_sequences == {}
+        assert second[0].children[0].content == "bold"
+        assert parser.ast is second
+
+    def test_parse_result_outlives_reset(self, tmp_path: Path) -> None:
+        """A ParseResult keeps its maps and compiles without the parser"""
+        parser = Parser(r".slide{.body{Use \.o\{bullet\}}}")
+        result = parser.parse_result()
+        parser.reset(".slide{.body{other}}")
+        parser.parse()
+
+        assert result.ast[0].directive == "slide"
+        assert result.escaped_sequences == {0: ".o{bullet}"}
+
+        compiler = Compiler(
+            ast=result,
+            output_dir=str(tmp_path / "output"),
+            assets_dir="assets",
+        )
+        html = compiler.ast_compile(compiler.ast)
+        assert ".o{bullet}" in html or ".o&#123;bullet&#125;" in html
+
+    def test_parse_many_matches_separate_parses(self) -> None:
+        """A batch parse yields what parsing each source alone would"""
+        sources = [
+            ".slide{.bf{one}}",
+            r".tt{\.o\{two\}}",
+            ".slide{.code{.syntax{python}\nx = 3\n}}",
+        ]
+
+        results = Parser.parse_many(sources)
+
+        assert results == [Parser(source).parse_result() for source in sources]
+        assert results[1].escaped_sequences == {0: ".o{two}"}
+        assert results[0].escaped_sequences == {}
+
+    def test_parse_result_clone_is_independent(self) -> None:
+        """A cloned ParseResult shares no mutable state with the original"""
+        result = Parser(r".slide{.bf{bold} \.o\{x\}}").parse_result()
+        copied = result.clone()
+
+        assert copied == result
+        copied.ast[0].children[0].content = "changed"
+        copied.escaped_sequences[99] = "changed"
+
+        assert result.ast[0].children[0].content == "bold"
+        assert 99 not in result.escaped_sequences
+
 
 class TestWhitespace:
     """Test whitespace handling"""
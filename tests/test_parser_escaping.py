@@ -6,16 +6,24 @@ Tests the two-layer protection system:
 2. Backslash escaping (protect valid directives from being parsed)
 """
 
+from collections.abc import Callable
+from dataclasses import replace
+
 from slidedown.lib.directives import DirectiveRegistry
 from slidedown.lib.parser import Parser
 
+# Signature of the ``parser_reused`` fixture from conftest.py
+ParserReused = Callable[[str], Parser]
+
 
 class TestDirectiveValidation:
     """Test that only registered directive names are parsed"""
 
-    def test_invalid_directive_name_ignored(self) -> None:
+    def test_invalid_directive_name_ignored(
+        self, parser_reused: ParserReused
+    ) -> None:
         """Invalid directive names should be passed through as text"""
-        parser = Parser(".tt{.directive{content}}")
+        parser = parser_reused(".tt{.directive{content}}")
         nodes = parser.parse()
 
         assert len(nodes) == 1
@@ -24,9 +32,11 @@ class TestDirectiveValidation:
         assert nodes[0].content == ".directive{content}"
         assert len(nodes[0].children) == 0
 
-    def test_multiple_invalid_directives_ignored(self) -> None:
+    def test_multiple_invalid_directives_ignored(
+        self, parser_reused: ParserReused
+    ) -> None:
         """Multiple invalid directives in content"""
-        parser = Parser(".body{.invalid{x} and .notreal{y}}")
+        parser = parser_reused(".body{.invalid{x} and .notreal{y}}")
         nodes = parser.parse()
 
         assert nodes[0].directive == "body"
@@ -34,9 +44,11 @@ class TestDirectiveValidation:
         assert ".notreal{y}" in nodes[0].content
         assert len(nodes[0].children) == 0
 
-    def test_valid_directive_is_parsed(self) -> None:
+    def test_valid_directive_is_parsed(
+        self, parser_reused: ParserReused
+    ) -> None:
         """Valid registered directives ARE parsed"""
-        parser = Parser(".tt{.bf{bold}}")
+        parser = parser_reused(".tt{.bf{bold}}")
         nodes = parser.parse()
 
         assert nodes[0].directive == "tt"
@@ -45,9 +57,11 @@ class TestDirectiveValidation:
         assert nodes[0].children[0].directive == "bf"
         assert nodes[0].children[0].content == "bold"
 
-    def test_mixed_valid_invalid_directives(self) -> None:
+    def test_mixed_valid_invalid_directives(
+        self, parser_reused: ParserReused
+    ) -> None:
         """Mix of valid and invalid directive names"""
-        parser = Parser(".body{.o{bullet} and .invalid{text}}")
+        parser = parser_reused(".body{.o{bullet} and .invalid{text}}")
         nodes = parser.parse()
 
         assert nodes[0].directive == "body"
@@ -57,13 +71,26 @@ class TestDirectiveValidation:
         # .invalid should remain in content (invalid)
         assert ".invalid{text}" in nodes[0].content
 
+    def test_top_level_directive_after_invalid_one(
+        self, parser_reused: ParserReused
+    ) -> None:
+        """Skipping an invalid top-level name must not skip the next one"""
+        parser = parser_reused("intro .unknown{x} .slide{y}")
+        nodes = parser.parse()
+
+        assert len(nodes) == 1
+        assert nodes[0].directive == "slide"
+        assert nodes[0].content == "y"
+
 
 class TestModifierValidation:
     """Test that modifiers (.style, .class, .syntax) are recognized"""
 
-    def test_style_modifier_extracted_when_first(self) -> None:
+    def test_style_modifier_extracted_when_first(
+        self, parser_reused: ParserReused
+    ) -> None:
         r"""\.style{} at start of content should be extracted as modifier"""
-        parser = Parser(".body{.style{color: red} Content}")
+        parser = parser_reused(".body{.style{color: red} Content}")
         nodes = parser.parse()
 
         assert nodes[0].directive == "body"
@@ -71,9 +98,11 @@ class TestModifierValidation:
         assert nodes[0].modifiers.get("style") == "color: red"
         assert nodes[0].content.strip() == "Content"
 
-    def test_style_in_middle_is_directive(self) -> None:
+    def test_style_in_middle_is_directive(
+        self, parser_reused: ParserReused
+    ) -> None:
         r"""\.style{} NOT at start should be treated as directive"""
-        parser = Parser(".tt{Text .style{color: red}}")
+        parser = parser_reused(".tt{Text .style{color: red}}")
         nodes = parser.parse()
 
         assert nodes[0].directive == "tt"
@@ -84,9 +113,11 @@ class TestModifierValidation:
         # Let's just verify it doesn't appear as plain text
         assert "Text .style{color: red}" != nodes[0].content
 
-    def test_class_modifier_extracted(self) -> None:
+    def test_class_modifier_extracted(
+        self, parser_reused: ParserReused
+    ) -> None:
         r"""\.class{} modifier should be extracted"""
-        parser = Parser(".body{.class{highlight} Content}")
+        parser = parser_reused(".body{.class{highlight} Content}")
         nodes = parser.parse()
 
         assert nodes[0].modifiers.get("class") == "highlight"
@@ -95,9 +126,11 @@ class TestModifierValidation:
 class TestBackslashEscaping:
     """Test backslash escaping of directive syntax"""
 
-    def test_escaped_valid_directive_shows_literally(self) -> None:
+    def test_escaped_valid_directive_shows_literally(
+        self, parser_reused: ParserReused
+    ) -> None:
         r"""Escaped directive \.bf\{...\} should show literally"""
-        parser = Parser(r".tt{\.bf\{bold\}}")
+        parser = parser_reused(r".tt{\.bf\{bold\}}")
         nodes = parser.parse()
 
         assert len(nodes) == 1
@@ -110,9 +143,11 @@ class TestBackslashEscaping:
         # Content should have placeholder
         assert "ESCAPE_0" in nodes[0].content
 
-    def test_escaped_modifier_shows_literally(self) -> None:
+    def test_escaped_modifier_shows_literally(
+        self, parser_reused: ParserReused
+    ) -> None:
         r"""Escaped \.style\{...\} should show literally"""
-        parser = Parser(r".tt{\.style\{color: red\}}")
+        parser = parser_reused(r".tt{\.style\{color: red\}}")
         nodes = parser.parse()
 
         assert nodes[0].directive == "tt"
@@ -120,9 +155,11 @@ class TestBackslashEscaping:
         assert 0 in parser.escaped_sequences
         assert parser.escaped_sequences[0] == ".style{color: red}"
 
-    def test_multiple_escaped_sequences(self) -> None:
+    def test_multiple_escaped_sequences(
+        self, parser_reused: ParserReused
+    ) -> None:
         r"""Multiple escaped sequences in one directive"""
-        parser = Parser(r".body{\.o\{first\} and \.bf\{second\}}")
+        parser = parser_reused(r".body{\.o\{first\} and \.bf\{second\}}")
         nodes = parser.parse()
 
         assert len(parser.escaped_sequences) == 2
@@ -132,9 +169,9 @@ class TestBackslashEscaping:
         assert "ESCAPE_0" in nodes[0].content
         assert "ESCAPE_1" in nodes[0].content
 
-    def test_escaped_nested_braces(self) -> None:
+    def test_escaped_nested_braces(self, parser_reused: ParserReused) -> None:
         r"""Escaped directive with nested braces"""
-        parser = Parser(r".tt{\.code\{function() \{ return x; \}\}}")
+        parser = parser_reused(r".tt{\.code\{function() \{ return x; \}\}}")
         parser.parse()
 
         assert 0 in parser.escaped_sequences
@@ -159,35 +196,43 @@ class TestBackslashEscaping:
 class TestEscapingEdgeCases:
     """Test edge cases and combinations"""
 
-    def test_escaped_invalid_directive(self) -> None:
+    def test_escaped_invalid_directive(
+        self, parser_reused: ParserReused
+    ) -> None:
         r"""Escaping an invalid directive name (unnecessary but should work)"""
-        parser = Parser(r".tt{\.invalid\{content\}}")
+        parser = parser_reused(r".tt{\.invalid\{content\}}")
         parser.parse()
 
         # Should still be escaped and stored
         assert 0 in parser.escaped_sequences
         assert parser.escaped_sequences[0] == ".invalid{content}"
 
-    def test_partial_escape_backslash_only_before_dot(self) -> None:
+    def test_partial_escape_backslash_only_before_dot(
+        self, parser_reused: ParserReused
+    ) -> None:
         r"""Backslash before dot but not braces"""
-        parser = Parser(r".tt{\.bf{text}}")
+        parser = parser_reused(r".tt{\.bf{text}}")
         parser.parse()
 
         # Should still recognize the escape pattern
         # The escaping looks for \. at the start
         assert 0 in parser.escaped_sequences
 
-    def test_backslash_in_regular_text(self) -> None:
+    def test_backslash_in_regular_text(
+        self, parser_reused: ParserReused
+    ) -> None:
         """Backslash not followed by directive pattern"""
-        parser = Parser(r".tt{This is \\ a backslash}")
+        parser = parser_reused(r".tt{This is \\ a backslash}")
         nodes = parser.parse()
 
         # Should pass through (no directive pattern to escape)
         assert r"\\" in nodes[0].content or "\\" in nodes[0].content
 
-    def test_escaped_directive_at_start_of_content(self) -> None:
+    def test_escaped_directive_at_start_of_content(
+        self, parser_reused: ParserReused
+    ) -> None:
         r"""Escaped directive at the very start"""
-        parser = Parser(r".body{\.style\{color: red\} Text}")
+        parser = parser_reused(r".body{\.style\{color: red\} Text}")
         nodes = parser.parse()
 
         # Even though .style{} is normally extracted as an initial modifier,
@@ -195,9 +240,11 @@ class TestEscapingEdgeCases:
         assert 0 in parser.escaped_sequences
         assert "style" not in nodes[0].modifiers
 
-    def test_nested_escaped_directive(self) -> None:
+    def test_nested_escaped_directive(
+        self, parser_reused: ParserReused
+    ) -> None:
         r"""Escaped directive inside another directive"""
-        parser = Parser(r".o{Use \.tt\{code\} for inline code}")
+        parser = parser_reused(r".o{Use \.tt\{code\} for inline code}")
         nodes = parser.parse()
 
         assert nodes[0].directive == "o"
@@ -208,14 +255,16 @@ class TestEscapingEdgeCases:
 class TestEndToEndEscaping:
     """Test complete parsing + compilation of escaped directives"""
 
-    def test_escaped_directive_compiles_to_literal_text(self) -> None:
+    def test_escaped_directive_compiles_to_literal_text(
+        self, parser_reused: ParserReused
+    ) -> None:
         r"""Verify escaped directive becomes literal HTML text"""
         import tempfile
         from pathlib import Path
 
         from slidedown.lib.compiler import Compiler
 
-        parser = Parser(r".slide{.body{Use \.o\{bullet\} for bullets}}")
+        parser = parser_reused(r".slide{.body{Use \.o\{bullet\} for bullets}}")
         ast = parser.parse()
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -236,7 +285,9 @@ class TestEndToEndEscaping:
                 or ".o{" in result
             )
 
-    def test_multiple_escapes_in_real_example(self) -> None:
+    def test_multiple_escapes_in_real_example(
+        self, parser_reused: ParserReused
+    ) -> None:
         r"""Real-world example from documentation"""
         source = r""".slide{
   .title{Slidedown Syntax}
@@ -247,7 +298,7 @@ class TestEndToEndEscaping:
     Modifiers like \.style\{color: red\} control appearance.
   }
 }"""
-        parser = Parser(source)
+        parser = parser_reused(source)
         ast = parser.parse()
 
         # Should have 3 escaped sequences
@@ -289,3 +340,33 @@ class TestRegistryIntegration:
 
         # Non-existent directives return None
         assert parser.registry.get("nonexistent") is None
+
+    def test_registered_names_are_interned(self) -> None:
+        """Parsed directive names are the very strings the registry keys"""
+        registry = DirectiveRegistry()
+        bold = registry.spec_get("bf")
+        assert bold is not None
+        name = "-".join(["big", "bold"])  # built at runtime, not a constant
+        registry.register(replace(bold, name=name, aliases=[]))
+
+        node = Parser(".big-bold{x}", registry=registry).parse()[0]
+        key = next(key for key in registry.specs if key == "big-bold")
+
+        assert node.directive is key
+
+    def test_registering_after_a_miss(self) -> None:
+        """A name looked up before it was registered resolves afterwards"""
+        registry = DirectiveRegistry()
+        assert registry.get("custom") is None
+        assert registry.get("font-slant") is not None
+        assert Parser(".custom{x}", registry=registry).parse() == []
+
+        bold = registry.spec_get("bf")
+        assert bold is not None
+        spec = replace(bold, name="custom", aliases=[])
+        registry.register(spec)
+
+        assert registry.spec_get("custom") is spec
+        assert registry.spec_get("font-slant") is registry.spec_get("font-*")
+        ast = Parser(".custom{x}", registry=registry).parse()
+        assert ast[0].directive == "custom"
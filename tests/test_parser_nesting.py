@@ -7,7 +7,9 @@ Tests nested directives at various depths and validates that:
 - Placeholder indices match children array indices
 """
 
-from slidedown.lib.parser import Parser
+import sys
+
+from slidedown.lib.parser import Parser, ast_flatten
 
 
 class TestSingleLevelNesting:
@@ -209,6 +211,45 @@ class TestMultiLevelNesting:
         assert o2.content == "Second bullet"
         assert len(o2.children) == 0
 
+    def test_ast_flatten_is_document_order(self) -> None:
+        """ast_flatten lists parents before children, in source order"""
+        parser = Parser(
+            ".slide{.title{T} .body{.o{.bf{a}} .o{b}}} .slide{.body{c}}"
+        )
+        nodes = parser.parse()
+
+        flat = ast_flatten(nodes)
+
+        assert [node.directive for node in flat] == [
+            "slide",
+            "title",
+            "body",
+            "o",
+            "bf",
+            "o",
+            "slide",
+            "body",
+        ]
+        assert flat[0] is nodes[0]
+
+    def test_nesting_deeper_than_recursion_limit(self) -> None:
+        """Parsing and cloning are not bounded by the call stack depth"""
+        depth = sys.getrecursionlimit() + 100
+        source = ".slide{" + ".o{" * depth + "x" + "}" * depth + "}"
+        parsed = [
+            Parser(source).parse()[0],
+            Parser.parse_cached(source).ast[0],
+            Parser(source).parse_result().clone().ast[0],
+        ]
+
+        for node in parsed:
+            for _ in range(depth):
+                assert node.content == "\x00CHILD_0\x00"
+                node = node.children[0]
+
+            assert node.directive == "o"
+            assert node.content == "x"
+
 
 class TestPlaceholderFormat:
     """Test placeholder format and positioning"""
@@ -264,3 +305,42 @@ class TestPlaceholderFormat:
 
         # Leading and trailing spaces should be preserved
         assert body.content == "  \x00CHILD_0\x00  "
+
+    def test_parts_split_at_placeholders(self) -> None:
+        """parts() interleaves text runs with child indices"""
+        parser = Parser(".body{Hello .bf{bold} and .tt{mono}!}")
+        nodes = parser.parse()
+
+        body = nodes[0]
+
+        assert body.parts() == ["Hello ", 0, " and ", 1, "!"]
+        assert body.children[0].parts() == ["bold"]
+
+    def test_parts_follow_reassigned_content(self) -> None:
+        """Rewriting content invalidates the split the parser recorded"""
+        parser = Parser(".body{Hello .bf{bold} and .tt{mono}!}")
+        body = parser.parse()[0]
+
+        body.content = "\x00CHILD_1\x00 first"
+
+        assert body.parts() == ["", 1, " first"]
+
+    def test_parts_follow_removed_children(self) -> None:
+        """Dropping a child leaves its placeholder as text, not an index"""
+        body = Parser(".body{a .bf{x} b .tt{y}}").parse()[0]
+
+        body.children.pop()
+
+        assert body.parts() == ["a ", 0, " b \x00CHILD_1\x00"]
+
+    def test_placeholders_beyond_precomputed_range(self) -> None:
+        """Wide bodies number children past the precomputed placeholders"""
+        parser = Parser(".body{" + " ".join([".bf{x}"] * 300) + "}")
+        nodes = parser.parse()
+
+        body = nodes[0]
+
+        assert len(body.children) == 300
+        assert "\x00CHILD_255\x00 \x00CHILD_256\x00" in body.content
+        assert body.content.endswith("\x00CHILD_299\x00")
+        assert body.parts()[-2] == 299
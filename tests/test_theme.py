@@ -0,0 +1,150 @@
+"""
+Theme loading tests
+
+Tests theme discovery, header peeking, and configuration lookup against
+the bundled themes and small themes written to a temporary directory.
+"""
+
+from pathlib import Path
+
+import pytest
+from slidedown.lib.theme import (
+    THEME_HEADER_BYTES,
+    Theme,
+    ThemeError,
+    theme_headerPeek,
+    themes_describeAvailable,
+    themes_listAvailable,
+)
+
+
+def theme_write(themes_dir: Path, name: str, config_text: str) -> Path:
+    """Write a minimal theme directory and return its theme.yaml path.
+
+    Args:
+        themes_dir: Base directory that holds themes.
+        name: Theme directory name.
+        config_text: Raw ``theme.yaml`` content.
+
+    Returns:
+        Path to the written ``theme.yaml``.
+    """
+    theme_dir = themes_dir / name
+    theme_dir.mkdir(parents=True)
+    config_path = theme_dir / "theme.yaml"
+    config_path.write_text(config_text, encoding="utf-8")
+    return config_path
+
+
+class TestThemeLoading:
+    """Test constructing Theme objects"""
+
+    def test_missing_theme_directory(self, tmp_path: Path) -> None:
+        """An unknown theme name reports the expected directory"""
+        with pytest.raises(ThemeError, match="not found"):
+            Theme("absent", str(tmp_path))
+
+    def test_missing_theme_config(self, tmp_path: Path) -> None:
+        """A theme directory without theme.yaml is rejected"""
+        (tmp_path / "bare").mkdir()
+
+        with pytest.raises(ThemeError, match="missing theme.yaml"):
+            Theme("bare", str(tmp_path))
+
+    def test_config_parsed_on_first_access(self, tmp_path: Path) -> None:
+        """Construction succeeds; a bad theme.yaml fails when read"""
+        theme_write(tmp_path, "broken", "name: [unclosed\n")
+
+        theme = Theme("broken", str(tmp_path))
+        assert theme.cssPath_get() is None
+
+        with pytest.raises(ThemeError, match="Failed to parse"):
+            theme.config_get("name")
+
+
+class TestThemeDiscovery:
+    """Test listing and describing available themes"""
+
+    def test_bundled_themes_listed(self) -> None:
+        """Bundled themes are discovered by directory name"""
+        themes = themes_listAvailable()
+
+        assert "default" in themes
+        assert themes == sorted(themes)
+
+    def test_directory_without_config_skipped(self, tmp_path: Path) -> None:
+        """Directories lacking theme.yaml are not themes"""
+        theme_write(tmp_path, "real", 'name: "Real"\n')
+        (tmp_path / "not-a-theme").mkdir()
+
+        assert themes_listAvailable(str(tmp_path)) == ["real"]
+
+    def test_describe_returns_headers(self, tmp_path: Path) -> None:
+        """Describing themes returns only the header fields"""
+        theme_write(
+            tmp_path,
+            "plain",
+            'name: "Plain"\nversion: "2.0"\ncolors:\n  accent: "#fff"\n',
+        )
+
+        described = themes_describeAvailable(str(tmp_path))
+
+        assert described == {"plain": {"name": "Plain", "version": "2.0"}}
+
+
+class TestThemeHeaderPeek:
+    """Test partial parsing of theme.yaml headers"""
+
+    def test_large_config_header_read(self, tmp_path: Path) -> None:
+        """Header keys are found without parsing the whole file"""
+        padding = "".join(
+            f"  key_{i}: value_{i}\n" for i in range(THEME_HEADER_BYTES)
+        )
+        config_path = theme_write(
+            tmp_path,
+            "big",
+            f'name: "Big"\ndescription: "Lots"\nextra:\n{padding}',
+        )
+
+        header = theme_headerPeek(config_path)
+
+        assert header == {"name": "Big", "description": "Lots"}
+
+    def test_unparseable_slice_falls_back(self, tmp_path: Path) -> None:
+        """A header slice cut inside a block falls back to a full parse"""
+        long_text = "x" * THEME_HEADER_BYTES
+        config_path = theme_write(
+            tmp_path,
+            "quoted",
+            f'description: "start\n  {long_text}\n  end"\nname: "Quoted"\n',
+        )
+
+        header = theme_headerPeek(config_path)
+
+        assert header is not None
+        assert header["name"] == "Quoted"
+
+    def test_non_mapping_config_rejected(self, tmp_path: Path) -> None:
+        """A theme.yaml that is not a mapping yields no header"""
+        config_path = theme_write(tmp_path, "list", "- one\n- two\n")
+
+        assert theme_headerPeek(config_path) is None
+
+
+class TestThemeConfigGet:
+    """Test key lookups in Theme.config_get"""
+
+    def test_config_get_plain_and_dotted_keys(self, tmp_path: Path) -> None:
+        """Top-level and dotted keys resolve; misses return the default"""
+        themes_dir: Path = tmp_path / "themes"
+        theme_write(
+            themes_dir,
+            "plain",
+            "name: plain\ncolors:\n  background: black\n",
+        )
+        theme: Theme = Theme("plain", str(themes_dir))
+
+        assert theme.config_get("name") == "plain"
+        assert theme.config_get("colors.background") == "black"
+        assert theme.config_get("missing", "fallback") == "fallback"
+        assert theme.config_get("name.nested", "fallback") == "fallback"